@@ -0,0 +1,218 @@
+"""
+Arayüzsüz toplu işleme.
+Bir dosya desenine uyan tüm görüntülere işlem zincirini uygular ve sonuçları
+çıkış klasörüne yazar. Çözme, işleme ve kodlama süreç havuzunda yapılır;
+PyQt5 hiç yüklenmez.
+
+Örnek:
+    python batch.py "girdiler/*.jpg" ciktilar --op median_filter:5 --op otsu_threshold
+    python batch.py "girdiler/**/*.png" ciktilar --op contrast_stretching:min_out=20,max_out=230 --ext .png
+"""
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import cv2
+import numpy as np
+
+from processing.filters import (
+    mean_filter, median_filter, edge_detection, sharpening_filter, smoothing_filter, box_filter
+)
+from processing.histogram import histogram_equalization, contrast_stretching, contrast_spreading
+from processing.geometry import rotate_image, flip_image
+from processing.threshold import (
+    manual_threshold, otsu_threshold, kapur_threshold, local_threshold, adaptive_local_threshold,
+    niblack_threshold, sauvola_threshold
+)
+from processing.morphology import dilation, erosion, rect_max, rect_min
+from processing.analysis import zhang_suen_thinning
+from processing.pipeline import Pipeline
+from processing import instrumentation
+
+# Komut satırından kullanılabilen işlemler (görüntü alıp görüntü döndürenler)
+OPERATIONS = {func.__name__: func for func in (
+    mean_filter, median_filter, edge_detection, sharpening_filter, smoothing_filter, box_filter,
+    histogram_equalization, contrast_stretching, contrast_spreading,
+    rotate_image, flip_image,
+    manual_threshold, otsu_threshold, kapur_threshold, local_threshold, adaptive_local_threshold,
+    niblack_threshold, sauvola_threshold,
+    dilation, erosion, rect_max, rect_min,
+    zhang_suen_thinning,
+)}
+
+def _parse_value(text):
+    # Sayılar, demetler vb. Python sabiti olarak; diğerleri düz metin olarak
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+def parse_operation(spec):
+    """
+    'isim[:arg,...,anahtar=değer]' biçimindeki işlemi (func, args, kwargs) adımına çevirir.
+    Örnek: 'median_filter:5', 'flip_image:mode=vertical'
+    """
+    name, _, arg_text = spec.partition(':')
+    func = OPERATIONS.get(name.strip())
+    if func is None:
+        raise ValueError("Bilinmeyen işlem: %r (kullanılabilir: %s)"
+                         % (name, ', '.join(sorted(OPERATIONS))))
+    args = []
+    kwargs = {}
+    for item in filter(None, (part.strip() for part in arg_text.split(','))):
+        key, sep, value = item.partition('=')
+        if sep:
+            kwargs[key.strip()] = _parse_value(value.strip())
+        elif kwargs:
+            raise ValueError("Konumsal argüman anahtarlı argümandan sonra gelemez: %r" % spec)
+        else:
+            args.append(_parse_value(item))
+    return func, tuple(args), kwargs
+
+def output_path(path, input_root, output_dir, extension=None, suffix=''):
+    """Giriş dosyasının çıkış klasöründeki yolu; giriş köküne göre alt klasörler korunur."""
+    relative = os.path.relpath(path, input_root)
+    stem, original_extension = os.path.splitext(relative)
+    return os.path.join(output_dir, stem + suffix + (extension or original_extension))
+
+# Süreç başına bir kez kurulan işçi durumu
+_worker_pipeline = None
+_worker_read_flag = cv2.IMREAD_COLOR
+
+def _init_worker(steps, read_flag, trace=False):
+    global _worker_pipeline, _worker_read_flag
+    # Paralellik süreç düzeyinde; OpenCV'nin iç iş parçacıkları çekirdekleri aşırı yüklemesin
+    cv2.setNumThreads(1)
+    instrumentation.enable(trace)
+    _worker_pipeline = Pipeline(steps)
+    _worker_read_flag = read_flag
+
+def _process_file(source, destination):
+    # np.fromfile/imdecode ve imencode/tofile: Türkçe karakterli yollarda da çalışır
+    data = np.fromfile(source, dtype=np.uint8)
+    image = instrumentation.call_named('decode', cv2.imdecode, data, _worker_read_flag)
+    if image is None:
+        raise ValueError("Görüntü okunamadı")
+    result = _worker_pipeline(image)
+    ok, encoded = instrumentation.call_named('encode', _encode, result, os.path.splitext(destination)[1])
+    if not ok:
+        raise ValueError("Görüntü kodlanamadı")
+    os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+    encoded.tofile(destination)
+    # Kayıt açıksa bu süreçte biriken olaylar ana sürece gönderilir
+    return instrumentation.drain() if instrumentation.enabled else None
+
+def _encode(image, extension):
+    return cv2.imencode(extension, np.ascontiguousarray(image))
+
+def run_batch(paths, steps, output_dir, workers=None, max_in_flight=None,
+              extension=None, suffix='', grayscale=False, progress=None, trace=False):
+    """
+    Görüntüleri süreç havuzunda işler. Aynı anda en fazla max_in_flight dosya
+    kuyrukta/işlemde bulunur; böylece bellek kullanımı dosya sayısından bağımsızdır.
+    trace=True ise işçilerdeki çözme/işlem/kodlama süreleri bu sürecin
+    instrumentation kayıtlarına eklenir.
+    (başarılı sayısı, [(yol, hata mesajı), ...], geçen süre) döndürür.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    if not paths:
+        return 0, [], 0.0
+    input_root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+    read_flag = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+    succeeded = 0
+    failures = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(steps, read_flag, trace)) as executor:
+        pending = {}
+        remaining = iter(paths)
+        while True:
+            for path in remaining:
+                destination = output_path(os.path.abspath(path), input_root, output_dir, extension, suffix)
+                pending[executor.submit(_process_file, path, destination)] = path
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    worker_events = future.result()
+                    succeeded += 1
+                    if worker_events:
+                        instrumentation.extend(worker_events)
+                except Exception as e:
+                    failures.append((path, str(e)))
+                if progress is not None:
+                    progress(succeeded + len(failures), len(paths))
+    return succeeded, failures, time.perf_counter() - start
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        description="Görüntüleri arayüz olmadan toplu olarak işler.",
+        epilog="Kullanılabilir işlemler: " + ', '.join(sorted(OPERATIONS))
+    )
+    parser.add_argument('input', help='Giriş dosya deseni, ör. "girdiler/*.jpg" (** alt klasörleri kapsar)')
+    parser.add_argument('output_dir', help='Çıkış klasörü')
+    parser.add_argument('-o', '--op', dest='operations', action='append', default=[],
+                        metavar='İŞLEM[:ARG,...]',
+                        help='Zincire eklenecek işlem; sırayla uygulanır (birden çok kez verilebilir)')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='İşçi süreç sayısı (varsayılan: çekirdek sayısı)')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='Aynı anda kuyrukta bulunabilecek en fazla dosya (varsayılan: 2 x işçi)')
+    parser.add_argument('--ext', default=None, help='Çıkış uzantısı, ör. .png (varsayılan: girişle aynı)')
+    parser.add_argument('--suffix', default='', help='Çıkış dosya adına eklenecek son ek')
+    parser.add_argument('--grayscale', action='store_true', help='Görüntüleri gri tonlamalı oku')
+    parser.add_argument('-q', '--quiet', action='store_true', help='İlerleme gösterme')
+    parser.add_argument('--trace', metavar='DOSYA',
+                        help='Adım sürelerini Chrome trace (JSON) olarak bu dosyaya yaz')
+    return parser
+
+def main(argv=None):
+    parser = _build_parser()
+    options = parser.parse_args(argv)
+    try:
+        steps = [parse_operation(spec) for spec in options.operations]
+    except ValueError as e:
+        parser.error(str(e))
+    extension = options.ext
+    if extension and not extension.startswith('.'):
+        extension = '.' + extension
+
+    paths = sorted(p for p in glob.glob(options.input, recursive=True) if os.path.isfile(p))
+    if not paths:
+        print("Desene uyan dosya bulunamadı: %s" % options.input, file=sys.stderr)
+        return 1
+
+    def report(done, total):
+        print("\r%d/%d" % (done, total), end='', file=sys.stderr, flush=True)
+
+    succeeded, failures, elapsed = run_batch(
+        paths, steps, options.output_dir,
+        workers=options.workers, max_in_flight=options.max_in_flight,
+        extension=extension, suffix=options.suffix, grayscale=options.grayscale,
+        progress=None if options.quiet else report, trace=bool(options.trace)
+    )
+    if not options.quiet:
+        print(file=sys.stderr)
+    for path, message in failures:
+        print("HATA %s: %s" % (path, message), file=sys.stderr)
+
+    if options.trace:
+        count = instrumentation.export_chrome_trace(options.trace)
+        print("%d kayıt yazıldı: %s" % (count, options.trace), file=sys.stderr)
+
+    rate = succeeded / elapsed if elapsed > 0 else 0.0
+    print("%d görüntü işlendi, %d hata, %.2f sn, %.2f görüntü/sn"
+          % (succeeded, len(failures), elapsed, rate))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""
+processing/* fonksiyonları için performans ölçümü.
+Belirlenimci (sabit tohumlu) sentetik görüntüler üzerinde her fonksiyonu farklı
+çözünürlüklerde, gri ve BGR girişlerle çalıştırır; süreyi ve tepe bellek
+kullanımını JSON olarak kaydeder. İki ölçüm dosyası karşılaştırılarak eşiği aşan
+yavaşlamalar raporlanır.
+
+Örnek:
+    python benchmark.py run -o once.json
+    python benchmark.py run -o sonra.json --baseline once.json --threshold 0.2
+    python benchmark.py compare once.json sonra.json
+"""
+import argparse
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+from processing import filters, histogram, geometry, threshold, morphology, analysis, labeling
+
+# Varsayılan çözünürlükler (genişlik; yükseklik genişliğin 3/4'ü)
+DEFAULT_SIZES = (256, 1024, 2048)
+DEFAULT_INPUTS = ('noise', 'text', 'gradient', 'blobs')
+# Bir fonksiyonun tek çağrısı bu süreyi aşarsa daha büyük boyutlarda atlanır (saniye)
+DEFAULT_BUDGET = 10.0
+# Yavaşlama sayılması için gereken göreli artış ve bunun dikkate alındığı en kısa süre
+DEFAULT_THRESHOLD = 0.25
+_MIN_COMPARABLE_SECONDS = 0.001
+
+# --- Sentetik girişler ---
+
+def _noise(height, width, rng):
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+def _text(height, width, rng):
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    line_height = max(12, height // 40)
+    scale = line_height / 30
+    for y in range(line_height, height, line_height + line_height // 2):
+        x = int(rng.integers(0, max(1, width // 20)))
+        while x < width:
+            word = ''.join(rng.choice(letters, int(rng.integers(2, 9))))
+            color = tuple(int(c) for c in rng.integers(0, 120, 3))
+            cv2.putText(image, word, (x, y), cv2.FONT_HERSHEY_SIMPLEX, scale, color, max(1, line_height // 12))
+            x += int(len(word) * 18 * scale) + line_height
+    return image
+
+def _gradient(height, width, rng):
+    y, x = np.mgrid[0:height, 0:width]
+    b = (255 * x / max(1, width - 1))
+    g = (255 * y / max(1, height - 1))
+    r = (255 * (x + y) / max(1, width + height - 2))
+    return np.dstack([b, g, r]).astype(np.uint8)
+
+def _blobs(height, width, rng):
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    for _ in range(max(4, height * width // 20000)):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        radius = int(rng.integers(3, max(4, min(height, width) // 12)))
+        cv2.circle(image, center, radius, (255, 255, 255), -1)
+    return image
+
+_GENERATORS = {
+    'noise': _noise,
+    'text': _text,
+    'gradient': _gradient,
+    'blobs': _blobs,
+}
+
+def make_input(kind, width, color, seed=0):
+    """Belirlenimci sentetik giriş: color 'bgr' ise 3 kanallı, 'gray' ise tek kanallı."""
+    height = width * 3 // 4
+    rng = np.random.default_rng(seed)
+    image = _GENERATORS[kind](height, width, rng)
+    if color == 'gray':
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return image
+
+def _binary(image):
+    # İkili girdi bekleyen işlemler için: gri görüntünün 127 eşiğiyle ikilenmiş hali
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return np.where(image > 127, 255, 0).astype(np.uint8)
+
+# --- Ölçülen fonksiyonlar ---
+
+class Case:
+    """
+    Ölçülecek tek fonksiyon çağrısı.
+    colors: desteklenen giriş türleri; prepare girişi fonksiyona uygun hale getirir
+    (ör. ikili maske); args/kwargs sabit parametrelerdir.
+    """
+
+    def __init__(self, func, *args, colors=('gray', 'bgr'), prepare=None, extra=None, label=None,
+                 requires=(), sizes=None, inputs=None, **kwargs):
+        self.func = func
+        # Verilirse komut satırındaki boyut/giriş listeleri yerine bunlar kullanılır
+        # (tek bir büyük ve ağır girişte ölçülmesi gereken durumlar için)
+        self.sizes = sizes
+        self.inputs = inputs
+        # Ölçüm için gereken isteğe bağlı modüller; biri yoksa durum atlanır
+        self.requires = requires
+        # Aynı fonksiyonun farklı parametrelerle ölçümlerini ayırt eden ek (ör. 'k=3')
+        self.label = label
+        self.args = args
+        self.kwargs = kwargs
+        self.colors = colors
+        self.prepare = prepare
+        # extra(giriş) -> ek konumsal argümanlar (ör. ağırlık merkezi)
+        self.extra = extra
+
+    @property
+    def name(self):
+        module = self.func.__module__.rsplit('.', 1)[-1]
+        name = f"{module}.{self.func.__name__}"
+        return f"{name}[{self.label}]" if self.label else name
+
+    def missing_requirement(self):
+        """Kurulu olmayan ilk isteğe bağlı modülün adı (hepsi kuruluysa None)."""
+        for module in self.requires:
+            if importlib.util.find_spec(module) is None:
+                return module
+        return None
+
+    def bind(self, image):
+        if self.prepare is not None:
+            image = self.prepare(image)
+        args = self.args if self.extra is None else tuple(self.extra(image)) + self.args
+        return lambda: self.func(image, *args, **self.kwargs)
+
+CASES = [
+    Case(filters.mean_filter, 5),
+    Case(filters.box_filter, 5),
+    Case(filters.median_filter, 5),
+    Case(filters.median_filter, 15, method='histogram', colors=('gray',), label='histogram'),
+    Case(filters.edge_detection),
+    Case(filters.sharpening_filter),
+    Case(filters.smoothing_filter, 5),
+    Case(histogram.histogram_equalization),
+    Case(histogram.contrast_stretching),
+    Case(histogram.contrast_spreading),
+    Case(geometry.rotate_image, 90),
+    Case(geometry.flip_image, 'horizontal'),
+    Case(threshold.manual_threshold, 127),
+    Case(threshold.otsu_threshold),
+    Case(threshold.kapur_threshold),
+    Case(threshold.local_threshold, 16, 5),
+    Case(threshold.adaptive_local_threshold, 51, 10),
+    Case(threshold.niblack_threshold, 25),
+    Case(threshold.sauvola_threshold, 25),
+    Case(morphology.dilation, 5, colors=('gray',), prepare=_binary),
+    Case(morphology.erosion, 5, colors=('gray',), prepare=_binary),
+    Case(morphology.rect_max, 5, colors=('gray',)),
+    Case(morphology.rect_min, 5, colors=('gray',)),
+    # Arayüzün varsayılanı k=3: küçük kernelde de piksel başı maliyet sabit kalmalı
+    Case(morphology.dilation, 3, colors=('gray',), prepare=_binary, label='k=3'),
+    Case(morphology.rect_max, 3, colors=('gray',), label='k=3'),
+    Case(morphology.rect_max, 15, colors=('gray',), label='k=15'),
+    Case(analysis.center_of_mass, colors=('gray',), prepare=_binary),
+    Case(labeling.connected_components, colors=('gray',), prepare=_binary),
+    Case(analysis.mark_center_of_mass, colors=('bgr',),
+         extra=lambda image: (labeling.connected_components(_binary(image)),)),
+    Case(analysis.zhang_suen_thinning, colors=('gray',), prepare=_binary),
+    # 12 MP, büyük ölçüde örtüşen bloblar: ~1450 alt adımda ~11.5 milyon piksel silinir
+    Case(analysis.zhang_suen_thinning, colors=('gray',), prepare=_binary,
+         sizes=(4000,), inputs=('blobs',), label='12MP blobs'),
+]
+
+# --- Ölçüm ---
+
+def _time_call(call, repeat):
+    call()  # ısınma (önbellekler, tembel ilklendirme)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return times
+
+def _peak_memory(call):
+    # NumPy ve Python ayırmaları izlenir (OpenCV'nin kendi ayırmaları hariç)
+    tracemalloc.start()
+    try:
+        call()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _is_missing_dependency(error):
+    # İsteğe bağlı modül ya da modülde olmayan yöntem (ör. opencv-contrib'siz cv2.ximgproc)
+    if isinstance(error, (ImportError, NotImplementedError)):
+        return True
+    return isinstance(error, AttributeError) and str(error).startswith('module ')
+
+def result_key(entry):
+    return entry['function'], entry['input'], entry['color'], tuple(entry['shape'])
+
+def run_benchmarks(sizes=DEFAULT_SIZES, inputs=DEFAULT_INPUTS, repeat=3, budget=DEFAULT_BUDGET,
+                   only=None, log=None):
+    """Tüm durumları ölçer; her biri bir sözlük olan sonuç listesini döndürür."""
+    results = []
+    for case in CASES:
+        if only and not any(pattern in case.name for pattern in only):
+            continue
+        skip_reason = None
+        missing = case.missing_requirement()
+        if missing is not None:
+            skip_reason = f"{missing} kurulu değil"
+        for width in sorted(case.sizes or sizes):
+            for kind in case.inputs or inputs:
+                for color in case.colors:
+                    image = make_input(kind, width, color)
+                    entry = {
+                        'function': case.name,
+                        'input': kind,
+                        'color': color,
+                        'shape': list(image.shape),
+                    }
+                    if skip_reason is not None:
+                        entry.update({'status': 'skipped', 'reason': skip_reason})
+                        results.append(entry)
+                        if log is not None:
+                            log(entry)
+                        continue
+                    try:
+                        call = case.bind(image)
+                        times = _time_call(call, repeat)
+                        entry.update({
+                            'status': 'ok',
+                            'min_s': min(times),
+                            'median_s': statistics.median(times),
+                            'peak_bytes': _peak_memory(call),
+                        })
+                        if min(times) > budget:
+                            skip_reason = f"süre bütçesi aşıldı ({min(times):.1f} sn > {budget:g} sn)"
+                    except Exception as e:
+                        status = 'skipped' if _is_missing_dependency(e) else 'error'
+                        key = 'reason' if status == 'skipped' else 'error'
+                        entry.update({'status': status, key: f"{type(e).__name__}: {e}"})
+                    results.append(entry)
+                    if log is not None:
+                        log(entry)
+    return results
+
+def environment():
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+    }
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    İki ölçümün ortak durumlarını karşılaştırır. En kısa süresi (min_s) taban
+    ölçüme göre threshold oranından fazla artanları (durum, oran) listesi olarak döndürür.
+    """
+    previous = {result_key(e): e for e in baseline['results'] if e.get('status') == 'ok'}
+    regressions = []
+    for entry in current['results']:
+        old = previous.get(result_key(entry))
+        if old is None or entry.get('status') != 'ok':
+            continue
+        if max(old['min_s'], entry['min_s']) < _MIN_COMPARABLE_SECONDS:
+            continue
+        ratio = entry['min_s'] / old['min_s']
+        if ratio > 1.0 + threshold:
+            regressions.append((entry, ratio))
+    return regressions
+
+def _format_entry(entry):
+    shape = 'x'.join(str(s) for s in entry['shape'])
+    label = f"{entry['function']:<44} {entry['input']:<9} {entry['color']:<5} {shape:<14}"
+    if entry['status'] != 'ok':
+        return f"{label} {entry['status']} {entry.get('error') or entry.get('reason', '')}"
+    return f"{label} {entry['min_s'] * 1000:10.2f} ms {entry['peak_bytes'] / 2**20:9.1f} MB"
+
+def _report_regressions(regressions, threshold):
+    if not regressions:
+        print(f"Eşiği (%{threshold * 100:.0f}) aşan yavaşlama yok.")
+        return 0
+    print(f"Eşiği (%{threshold * 100:.0f}) aşan {len(regressions)} yavaşlama:")
+    for entry, ratio in sorted(regressions, key=lambda item: -item[1]):
+        print(f"  {_format_entry(entry)}  x{ratio:.2f}")
+    return 1
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="processing/* fonksiyonlarının performans ölçümü.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Ölçümleri çalıştır ve JSON olarak kaydet')
+    run.add_argument('-o', '--output', help='Sonuç JSON dosyası')
+    run.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                     help='Görüntü genişlikleri (yükseklik = 3/4 genişlik)')
+    run.add_argument('--inputs', nargs='+', choices=sorted(_GENERATORS), default=list(DEFAULT_INPUTS))
+    run.add_argument('--repeat', type=int, default=3, help='Her durum için ölçüm tekrarı')
+    run.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                     help='Tek çağrısı bu süreyi (sn) aşan fonksiyon büyük boyutlarda atlanır')
+    run.add_argument('--only', nargs='+', help='Yalnızca adı bu parçaları içeren fonksiyonlar')
+    run.add_argument('--baseline', help='Karşılaştırılacak önceki sonuç dosyası')
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                     help='Yavaşlama eşiği (0.25 = %%25)')
+
+    compare = commands.add_parser('compare', help='İki sonuç dosyasını karşılaştır')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    options = parser.parse_args(argv)
+    if options.command == 'compare':
+        regressions = compare_results(_load(options.baseline), _load(options.current), options.threshold)
+        return _report_regressions(regressions, options.threshold)
+
+    results = run_benchmarks(options.sizes, options.inputs, options.repeat, options.budget,
+                             options.only, log=lambda entry: print(_format_entry(entry), flush=True))
+    report = {
+        'environment': environment(),
+        'settings': {'sizes': options.sizes, 'inputs': options.inputs, 'repeat': options.repeat},
+        'results': results,
+    }
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if options.baseline:
+        regressions = compare_results(_load(options.baseline), report, options.threshold)
+        return _report_regressions(regressions, options.threshold)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# pytest kök dizini: testler processing/ ve gui/ paketlerini buradan içe aktarır
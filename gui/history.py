@@ -0,0 +1,213 @@
+import os
+import shutil
+import tempfile
+import zlib
+
+import numpy as np
+
+# Varsayılan bellek sınırı; aşıldığında en eski adımlar diske taşınır
+DEFAULT_HISTORY_BYTES = 256 * 1024 * 1024
+# Art arda en fazla bu kadar fark kaydından sonra tam (anahtar) maske saklanır
+_KEYFRAME_INTERVAL = 8
+
+def _is_binary_mask(image):
+    # Eşikleme/morfoloji çıktısı: yalnızca 0 ve 255 içeren 2B uint8 görüntü
+    if image.ndim != 2 or image.dtype != np.uint8:
+        return False
+    return not np.any((image != 0) & (image != 255))
+
+class _Entry:
+    """
+    Geçmişteki tek bir adım.
+    kind: 'empty' (işlenmiş görüntü yok), 'array' (dizi referansı),
+    'mask' (paketlenmiş ve sıkıştırılmış ikili maske) veya 'mask_diff'
+    (bir önceki maskeyle XOR farkı, sıkıştırılmış).
+    """
+    __slots__ = ('kind', 'payload', 'shape', 'meta', 'depth', 'path', 'nbytes')
+
+    def __init__(self, kind, payload, shape, meta, depth=0, nbytes=0):
+        self.kind = kind
+        self.payload = payload
+        self.shape = shape
+        self.meta = meta
+        self.depth = depth
+        self.path = None
+        self.nbytes = nbytes
+
+class History:
+    """
+    Kopyala-yaz mantığıyla geri al/yinele geçmişi.
+    - Diziler kopyalanmaz; işlemler yeni dizi döndürdüğü için referans saklamak
+      yeterlidir. Görünüm (view) döndüren işlemler (rotate_image, flip_image)
+      kaynakla aynı belleği paylaşır ve bütçeden düşülmez.
+    - İkili maskeler bit düzeyinde paketlenip sıkıştırılır; bir önceki maskeyle
+      aynı boyuttaysa yalnızca XOR farkı saklanır.
+    - Bellekteki toplam boyut memory_limit'i aşarsa en eski adımlar diske taşınır.
+    """
+
+    def __init__(self, memory_limit=DEFAULT_HISTORY_BYTES, max_steps=100):
+        self.memory_limit = memory_limit
+        self.max_steps = max_steps
+        self.entries = []
+        self.index = -1
+        self._spill_dir = None
+
+    def __del__(self):
+        self._remove_spill_dir()
+
+    # --- Gezinme ---
+
+    def can_undo(self):
+        return self.index > 0
+
+    def can_redo(self):
+        return self.index < len(self.entries) - 1
+
+    def current(self):
+        """(görüntü, meta) döndürür; geçmiş boşsa None."""
+        if self.index < 0:
+            return None
+        return self._decode(self.index), self.entries[self.index].meta
+
+    def undo(self):
+        if not self.can_undo():
+            return None
+        self.index -= 1
+        return self.current()
+
+    def redo(self):
+        if not self.can_redo():
+            return None
+        self.index += 1
+        return self.current()
+
+    # --- Kayıt ---
+
+    def clear(self):
+        self.entries = []
+        self.index = -1
+        self._remove_spill_dir()
+
+    def push(self, image, meta=None):
+        """Yeni adım ekler; ileri (yinelenebilir) adımlar silinir."""
+        for entry in self.entries[self.index + 1:]:
+            self._discard(entry)
+        del self.entries[self.index + 1:]
+        self.entries.append(self._encode(image, meta, len(self.entries)))
+        self.index = len(self.entries) - 1
+        self._enforce_limits()
+
+    def replace_current(self, image, meta=None):
+        """Geçerli adımın görüntüsünü değiştirir (ör. önizleme -> tam çözünürlük)."""
+        if self.index < 0:
+            self.push(image, meta)
+            return
+        # Sonraki adımlar bu adıma göre fark saklıyor olabilir; yinele geçmişi silinir
+        for entry in self.entries[self.index:]:
+            self._discard(entry)
+        del self.entries[self.index:]
+        self.entries.append(self._encode(image, meta, self.index))
+        self._enforce_limits()
+
+    @property
+    def memory_bytes(self):
+        return sum(e.nbytes for e in self.entries if e.path is None)
+
+    # --- Kodlama ---
+
+    def _encode(self, image, meta, position):
+        if image is None:
+            return _Entry('empty', None, None, meta)
+        if _is_binary_mask(image):
+            packed = np.packbits(image > 0)
+            previous = self.entries[position - 1] if position > 0 else None
+            if (previous is not None and previous.kind in ('mask', 'mask_diff')
+                    and previous.shape == image.shape and previous.depth < _KEYFRAME_INTERVAL):
+                diff = packed ^ self._packed_mask(position - 1)
+                payload = zlib.compress(diff.tobytes(), 1)
+                return _Entry('mask_diff', payload, image.shape, meta,
+                              depth=previous.depth + 1, nbytes=len(payload))
+            payload = zlib.compress(packed.tobytes(), 1)
+            return _Entry('mask', payload, image.shape, meta, nbytes=len(payload))
+        # Başka bir dizinin görünümü ise bellek zaten o dizide tutuluyor
+        owned = image.nbytes if image.base is None else 0
+        return _Entry('array', image, image.shape, meta, nbytes=owned)
+
+    def _payload(self, entry):
+        if entry.path is None:
+            return entry.payload
+        if entry.kind == 'array':
+            return np.load(entry.path)
+        with open(entry.path, 'rb') as f:
+            return f.read()
+
+    def _packed_mask(self, position):
+        entry = self.entries[position]
+        packed = np.frombuffer(zlib.decompress(self._payload(entry)), dtype=np.uint8)
+        if entry.kind == 'mask_diff':
+            packed = packed ^ self._packed_mask(position - 1)
+        return packed
+
+    def _decode(self, position):
+        entry = self.entries[position]
+        if entry.kind == 'empty':
+            return None
+        if entry.kind == 'array':
+            return self._payload(entry)
+        h, w = entry.shape
+        bits = np.unpackbits(self._packed_mask(position), count=h * w)
+        image = bits.reshape(h, w)
+        image *= 255
+        return image
+
+    # --- Sınırlar ---
+
+    def _enforce_limits(self):
+        while len(self.entries) > self.max_steps and self.index > 0:
+            self._drop_oldest()
+        # Geçerli adım hariç en eski adımları diske taşı
+        position = 0
+        while self.memory_bytes > self.memory_limit and position < len(self.entries):
+            entry = self.entries[position]
+            if position != self.index and entry.path is None and entry.nbytes > 0:
+                self._spill(entry)
+            position += 1
+
+    def _drop_oldest(self):
+        if len(self.entries) > 1 and self.entries[1].kind == 'mask_diff':
+            # Sonraki adım bu adıma göre fark tutuyor: onu tam maskeye çevir
+            following = self.entries[1]
+            payload = zlib.compress(self._packed_mask(1).tobytes(), 1)
+            shift = following.depth
+            self._discard(following)
+            following.kind, following.payload, following.depth = 'mask', payload, 0
+            following.path, following.nbytes = None, len(payload)
+            # Zincirdeki sonraki farklar artık bu adımı anahtar olarak kullanır
+            for entry in self.entries[2:]:
+                if entry.kind != 'mask_diff':
+                    break
+                entry.depth -= shift
+        self._discard(self.entries.pop(0))
+        self.index -= 1
+
+    def _spill(self, entry):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='imageprocessing-history-')
+        fd, path = tempfile.mkstemp(dir=self._spill_dir)
+        with os.fdopen(fd, 'wb') as f:
+            if entry.kind == 'array':
+                np.save(f, entry.payload)
+            else:
+                f.write(entry.payload)
+        entry.path = path
+        entry.payload = None
+
+    def _discard(self, entry):
+        if entry.path is not None and os.path.exists(entry.path):
+            os.remove(entry.path)
+        entry.path = None
+
+    def _remove_spill_dir(self):
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
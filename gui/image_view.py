@@ -0,0 +1,249 @@
+import math
+import weakref
+from collections import OrderedDict
+
+import cv2
+from PyQt5.QtCore import Qt, QPoint, QRectF
+from PyQt5.QtGui import QPainter, QPixmap
+from PyQt5.QtWidgets import QScrollArea, QWidget
+
+from gui.qimage import numpy_to_qimage
+
+# Piramidin en küçük seviyesinin uzun kenarı (piksel)
+_MIN_LEVEL_SIZE = 64
+# Ekrana çizilen karoların kenar uzunluğu (seviye pikseli)
+_TILE_SIZE = 256
+# Bellekte tutulan en fazla karo (QPixmap) sayısı
+_MAX_TILES = 256
+# Aynı anda önbellekte tutulan piramit sayısı (ör. geri al/yinele ile dönülen sonuçlar)
+_MAX_PYRAMIDS = 4
+# Yakınlaştırma sınırları ve Ctrl+tekerlek adımı
+_MIN_ZOOM = 1 / 64
+_MAX_ZOOM = 32.0
+_ZOOM_STEP = 1.25
+
+class DisplayPyramid:
+    """
+    Görüntünün ekran için yarıya küçültülmüş kopyaları. Seviye 0 görüntünün kendisidir
+    ve saklanmaz (çağıran her seferinde verir); böylece piramit görüntüyü bellekte
+    tutmaz. Seviyeler gerektiğinde bir öncekinden INTER_AREA ile üretilir ve saklanır.
+    """
+
+    def __init__(self):
+        self.reduced = []
+
+    def level(self, image, index):
+        return image if index == 0 else self.reduced[index - 1]
+
+    def level_for(self, image, zoom):
+        """
+        Verilen yakınlaştırma için en uygun seviyeyi döndürür: ekranda gösterilecek
+        piksellerden daha az piksel içermeyen en küçük seviye.
+        """
+        index = 0 if zoom >= 1.0 else int(math.floor(math.log2(1.0 / zoom)))
+        while len(self.reduced) < index:
+            previous = self.level(image, len(self.reduced))
+            h, w = previous.shape[:2]
+            if max(h, w) <= _MIN_LEVEL_SIZE:
+                break
+            size = (max(1, (w + 1) // 2), max(1, (h + 1) // 2))
+            self.reduced.append(cv2.resize(previous, size, interpolation=cv2.INTER_AREA))
+        return min(index, len(self.reduced))
+
+class _PyramidCache:
+    # Dizi nesnesine göre piramit önbelleği (dizi silinince kaydı da düşer; piramit
+    # diziye güçlü başvuru tutmadığı için zayıf başvuru gerçekten serbest kalır)
+    def __init__(self, max_entries=_MAX_PYRAMIDS):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, image):
+        key = id(image)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is image:
+            self._entries.move_to_end(key)
+            return entry[1]
+        pyramid = DisplayPyramid()
+        self._entries[key] = (weakref.ref(image, lambda _: self._entries.pop(key, None)), pyramid)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return pyramid
+
+class _Canvas(QWidget):
+    # Görüntünün yakınlaştırılmış boyutundaki yüzey; yalnızca görünen karoları çizer
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
+        self._drag_start = None
+
+    def paintEvent(self, event):
+        self.view.paint_tiles(self, event.rect())
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and not self.view.fit_to_window:
+            self._drag_start = (event.globalPos(), self.view.scroll_position())
+            self.setCursor(Qt.ClosedHandCursor)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start is not None:
+            origin, (x, y) = self._drag_start
+            delta = event.globalPos() - origin
+            self.view.set_scroll_position(x - delta.x(), y - delta.y())
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_start = None
+        self.unsetCursor()
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        self.view.set_fit_to_window(True)
+
+class ImageView(QScrollArea):
+    """
+    Büyük görüntüleri akıcı gösteren görüntüleyici.
+    - Görüntü başına bir ekran piramidi oluşturulur ve önbellekte tutulur; pencere
+      boyutu değişince en yakın seviyeden çizilir, tam görüntü yeniden dönüştürülmez.
+    - Yalnızca görünen alana düşen karolar QPixmap'e çevrilir (karolar önbelleklenir).
+    - Varsayılan olarak görüntü pencereye sığdırılır; Ctrl+tekerlek imlecin
+      altındaki noktaya göre yakınlaştırır, sürükleme kaydırır, çift tık sığdırır.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.setWidgetResizable(False)
+        self.canvas = _Canvas(self)
+        self.canvas.resize(0, 0)
+        self.setWidget(self.canvas)
+        self.fit_to_window = True
+        self.zoom = 1.0
+        self.image = None
+        self._pyramids = _PyramidCache()
+        self._pyramid = None
+        self._tiles = OrderedDict()
+
+    # --- Görüntü ---
+
+    def set_image(self, image):
+        """Görüntüyü gösterir; aynı dizi daha önce gösterildiyse piramidi yeniden kullanılır."""
+        self.image = image
+        self._pyramid = self._pyramids.get(image)
+        self._tiles.clear()
+        self._update_canvas()
+
+    def clear(self):
+        self.image = None
+        self._pyramid = None
+        self._tiles.clear()
+        self.canvas.resize(0, 0)
+        self.canvas.update()
+
+    # --- Yakınlaştırma ---
+
+    def fit_zoom(self):
+        if self.image is None:
+            return 1.0
+        h, w = self.image.shape[:2]
+        viewport = self.viewport().size()
+        return max(_MIN_ZOOM, min(viewport.width() / w, viewport.height() / h))
+
+    def set_fit_to_window(self, enabled):
+        self.fit_to_window = enabled
+        self._update_canvas()
+
+    def set_zoom(self, zoom, anchor=None):
+        """
+        Yakınlaştırmayı değiştirir. anchor (viewport koordinatı) verilirse o noktanın
+        altındaki görüntü pikseli yerinde kalır.
+        """
+        if self.image is None:
+            return
+        zoom = min(_MAX_ZOOM, max(_MIN_ZOOM, zoom))
+        if anchor is None:
+            anchor = QPoint(self.viewport().width() // 2, self.viewport().height() // 2)
+        canvas_point = self.canvas.mapFrom(self.viewport(), anchor)
+        image_x = canvas_point.x() / self.zoom
+        image_y = canvas_point.y() / self.zoom
+        self.fit_to_window = False
+        self.zoom = zoom
+        self._update_canvas()
+        # Yeni boyutta aynı görüntü noktasını imlecin altına getir
+        self.set_scroll_position(image_x * zoom - anchor.x(), image_y * zoom - anchor.y())
+
+    def scroll_position(self):
+        return self.horizontalScrollBar().value(), self.verticalScrollBar().value()
+
+    def set_scroll_position(self, x, y):
+        self.horizontalScrollBar().setValue(int(round(x)))
+        self.verticalScrollBar().setValue(int(round(y)))
+
+    def _update_canvas(self):
+        if self.image is None:
+            return
+        if self.fit_to_window:
+            self.zoom = self.fit_zoom()
+        h, w = self.image.shape[:2]
+        self.canvas.resize(max(1, int(round(w * self.zoom))), max(1, int(round(h * self.zoom))))
+        self.canvas.update()
+
+    # --- Olaylar ---
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.fit_to_window:
+            self._update_canvas()
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ControlModifier and self.image is not None:
+            step = _ZOOM_STEP if event.angleDelta().y() > 0 else 1 / _ZOOM_STEP
+            self.set_zoom(self.zoom * step, event.pos())
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    # --- Çizim ---
+
+    def _tile(self, level_index, tx, ty):
+        key = (level_index, tx, ty)
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+            return pixmap
+        level = self._pyramid.level(self.image, level_index)
+        y0, x0 = ty * _TILE_SIZE, tx * _TILE_SIZE
+        tile = level[y0:y0 + _TILE_SIZE, x0:x0 + _TILE_SIZE]
+        pixmap = QPixmap.fromImage(numpy_to_qimage(tile))
+        self._tiles[key] = pixmap
+        while len(self._tiles) > _MAX_TILES:
+            self._tiles.popitem(last=False)
+        return pixmap
+
+    def paint_tiles(self, canvas, rect):
+        """Canvas üzerindeki rect alanına düşen karoları uygun piramit seviyesinden çizer."""
+        if self._pyramid is None:
+            return
+        level_index = self._pyramid.level_for(self.image, self.zoom)
+        level = self._pyramid.level(self.image, level_index)
+        image_h, image_w = self.image.shape[:2]
+        level_h, level_w = level.shape[:2]
+        # Ekran pikseli başına seviye pikseli (eksen başına)
+        scale_x = level_w / (image_w * self.zoom)
+        scale_y = level_h / (image_h * self.zoom)
+        first_tx = max(0, int(rect.left() * scale_x) // _TILE_SIZE)
+        last_tx = min((level_w - 1) // _TILE_SIZE, int((rect.right() + 1) * scale_x) // _TILE_SIZE)
+        first_ty = max(0, int(rect.top() * scale_y) // _TILE_SIZE)
+        last_ty = min((level_h - 1) // _TILE_SIZE, int((rect.bottom() + 1) * scale_y) // _TILE_SIZE)
+
+        painter = QPainter(canvas)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, self.zoom * level_w / image_w < 4)
+        for ty in range(first_ty, last_ty + 1):
+            for tx in range(first_tx, last_tx + 1):
+                pixmap = self._tile(level_index, tx, ty)
+                x0, y0 = tx * _TILE_SIZE, ty * _TILE_SIZE
+                target = QRectF(x0 / scale_x, y0 / scale_y,
+                                pixmap.width() / scale_x, pixmap.height() / scale_y)
+                painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+        painter.end()
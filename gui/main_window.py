@@ -1,30 +1,60 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QWidget,
     QAction, QFileDialog, QFrame, QSizePolicy, QStatusBar, QSpacerItem,
-    QMenu, QInputDialog, QScrollArea, QApplication
+    QMenu, QInputDialog, QScrollArea, QApplication, QProgressBar, QShortcut
 )
-from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon, QCursor, QPalette, QColor
-from PyQt5.QtCore import Qt
-import cv2
-import numpy as np
+from PyQt5.QtGui import QFont, QIcon, QCursor, QPalette, QColor, QKeySequence
+from PyQt5.QtCore import Qt, QThreadPool
+import time
+
 from processing.filters import mean_filter, median_filter, edge_detection, sharpening_filter, smoothing_filter
 from processing.histogram import show_histogram, histogram_equalization, contrast_stretching, contrast_spreading
 from processing.geometry import rotate_image, flip_image
 from processing.threshold import manual_threshold, otsu_threshold, kapur_threshold, local_threshold, adaptive_local_threshold
 from processing.morphology import dilation, erosion
-from processing.analysis import center_of_mass, mark_center_of_mass, zhang_suen_thinning
+from processing.analysis import mark_center_of_mass, zhang_suen_thinning
+from processing.labeling import connected_components
+from gui.worker import OperationWorker
+from gui.preview import preview_scale, make_proxy, scale_parameters, run_chain
+from processing.cache import ResultCache, DEFAULT_CACHE_BYTES
+from processing import instrumentation
+from gui.history import History
+from gui.qimage import numpy_to_qimage, qimage_to_numpy
+from gui.image_view import ImageView
+
+def mark_center(image):
+    # Her nesnenin ağırlık merkezini bulup işaretler (arka planda tek işlem olarak çalıştırmak için)
+    return mark_center_of_mass(image, connected_components(image))
 
 class MainWindow(QMainWindow):
     """
     Ana pencere sınıfı - Görüntü işleme uygulamasının ana arayüzünü oluşturur
     """
-    def __init__(self):
+    def __init__(self, cache_bytes=DEFAULT_CACHE_BYTES):
         super().__init__()
         self.setWindowTitle("Görüntü İşleme Uygulaması")
         self.setWindowIcon(QIcon())  # İsterseniz buraya bir ikon dosyası ekleyebilirsiniz
         self.setMinimumSize(1200, 700)
         self.original_image = None
         self.processed_image = None
+
+        # Arka plan işlemleri: yalnızca en son isteğin sonucu gösterilir
+        self.thread_pool = QThreadPool()
+        self.request_id = 0
+        self.active_worker = None
+        self.operation_started = 0.0
+
+        # Önizleme modu: işlemler ekran çözünürlüğündeki küçük kopyada çalışır.
+        # operation_chain, processed_image'ı orijinalden üreten adımları tutar.
+        self.preview_mode = False
+        self.processed_is_preview = False
+        self.operation_chain = []
+
+        # Aynı girdi ve parametrelerle tekrar çalıştırılan işlemler önbellekten gelir
+        self.result_cache = ResultCache(max_bytes=cache_bytes)
+
+        # Geri al / yinele geçmişi (processed_image'ın önceki halleri)
+        self.history = History()
         
         # Tema modunu algıla ve uygula
         self.is_dark_mode = self.is_system_dark_mode()
@@ -38,11 +68,55 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("Dosya")
         file_menu.addAction(open_action)
 
+        self.preview_action = QAction("Önizleme Modu", self)
+        self.preview_action.setCheckable(True)
+        self.preview_action.setShortcut("Ctrl+P")
+        self.preview_action.toggled.connect(self.set_preview_mode)
+        render_full_action = QAction("Tam Çözünürlükte İşle", self)
+        render_full_action.setShortcut("Ctrl+R")
+        render_full_action.triggered.connect(self.render_full_resolution)
+        undo_action = QAction("Geri Al", self)
+        undo_action.setShortcut("Ctrl+Z")
+        undo_action.triggered.connect(self.undo)
+        redo_action = QAction("Yinele", self)
+        redo_action.setShortcuts(["Ctrl+Y", "Ctrl+Shift+Z"])
+        redo_action.triggered.connect(self.redo)
+        edit_menu = menubar.addMenu("Düzen")
+        edit_menu.addAction(undo_action)
+        edit_menu.addAction(redo_action)
+
+        view_menu = menubar.addMenu("Görünüm")
+        view_menu.addAction(self.preview_action)
+        view_menu.addAction(render_full_action)
+
+        # Performans kaydı: işlem süreleri ve boyutları, Chrome trace olarak dışa aktarılabilir
+        trace_action = QAction("Performans Kaydı", self)
+        trace_action.setCheckable(True)
+        trace_action.toggled.connect(self.set_tracing)
+        export_trace_action = QAction("Performans Kaydını Dışa Aktar...", self)
+        export_trace_action.triggered.connect(self.export_trace)
+        view_menu.addSeparator()
+        view_menu.addAction(trace_action)
+        view_menu.addAction(export_trace_action)
+
         # Durum çubuğu
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Hoş geldiniz! Lütfen bir resim açın.", 5000)
 
+        # İşlem ilerlemesi ve iptal
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.cancel_btn = QPushButton("İptal")
+        self.cancel_btn.clicked.connect(self.cancel_operation)
+        self.cancel_btn.hide()
+        self.status_bar.addPermanentWidget(self.progress_bar)
+        self.status_bar.addPermanentWidget(self.cancel_btn)
+        cancel_shortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
+        cancel_shortcut.activated.connect(self.cancel_operation)
+
         # Kenar çubuğu başlık
         sidebar_title = QLabel("İşlemler")
         sidebar_title.setFont(QFont("Arial", 16, QFont.Bold))
@@ -86,15 +160,16 @@ class MainWindow(QMainWindow):
         """)
 
         # Görüntü alanları
-        self.orig_label = QLabel()
-        self.proc_label = QLabel()
+        # Piramit önbellekli, yalnızca görünen karoları çizen görüntüleyiciler
+        self.orig_label = ImageView()
+        self.proc_label = ImageView()
         for label in [self.orig_label, self.proc_label]:
-            label.setAlignment(Qt.AlignCenter)
             label.setFrameShape(QFrame.Box)
             label.setStyleSheet(
-                f"background: {self.get_image_bg_color()}; color: {self.get_text_color()}; "
-                f"border: 2px solid {self.get_border_color()}; border-radius: 10px;"
+                f"ImageView {{ background: {self.get_image_bg_color()}; color: {self.get_text_color()}; "
+                f"border: 2px solid {self.get_border_color()}; border-radius: 10px; }}"
             )
+            label.viewport().setStyleSheet(f"background: {self.get_image_bg_color()};")
             label.setFont(QFont("Arial", 12, QFont.Bold))
             label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             label.setMinimumSize(420, 420)
@@ -389,25 +464,16 @@ class MainWindow(QMainWindow):
                 qimg = reader.read()
                 
                 if not qimg.isNull():
-                    qimg = qimg.convertToFormat(QImage.Format.Format_RGB888)
                     width = qimg.width()
                     height = qimg.height()
-                    ptr = qimg.bits()
-                    ptr.setsize(qimg.byteCount())
-                    arr = np.array(ptr)
-                    
-                    # Kanal sayısını kontrol et
-                    if arr.size == width * height * 3:
-                        arr = arr.reshape(height, width, 3)
-                        self.original_image = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
-                    elif arr.size == width * height:
-                        arr = arr.reshape(height, width)
-                        self.original_image = arr
-                    else:
-                        self.status_bar.showMessage("Resim formatı desteklenmiyor!", 5000)
-                        return
-                        
+                    # Qt'nin çözdüğü veri doğrudan BGR dizi olarak kullanılır
+                    self.original_image = qimage_to_numpy(qimg)
+
                     self.processed_image = None
+                    self.processed_is_preview = False
+                    self.operation_chain = []
+                    self.history.clear()
+                    self.history.push(None, (False, []))
                     self.show_image(self.original_image, self.orig_label)
                     self.proc_label.clear()
                     
@@ -426,27 +492,221 @@ class MainWindow(QMainWindow):
         Görüntüyü ekranda gösterme fonksiyonu
         """
         if img is not None:
-            if len(img.shape) == 2:
-                rgb_image = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-            else:
-                rgb_image = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qt_image)
-            label.setPixmap(pixmap.scaled(label.width(), label.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            label.set_image(img)
         else:
             label.clear()
 
+    def run_operation(self, func, *args, source="original", message="", store=True,
+                      on_result=None, **kwargs):
+        """
+        İşlemi arka plan iş parçacığında çalıştırır. Önceki işlem hâlâ sürüyorsa iptal
+        edilir; sonucu geldiğinde yalnızca bu en son isteğe aitse gösterilir.
+        source: işlemin girdisi ("original" veya "processed").
+        store=False ise sonuç processed_image olarak saklanmaz (yalnızca gösterilir).
+        on_result, sonuç gösterildikten sonra GUI iş parçacığında çağrılır.
+        Önizleme modunda işlem ekran boyutundaki küçük kopyada, ölçeklenmiş
+        kernel/pencere boyutlarıyla çalışır.
+        """
+        step = (func, args, kwargs)
+        chain = [step] if source == "original" else self.operation_chain + [step]
+
+        if self.preview_mode:
+            if source == "original" or not self.processed_is_preview:
+                full_input = self.original_image if source == "original" else self.processed_image
+                scale = preview_scale(full_input.shape, self.proc_label.width(), self.proc_label.height())
+                image = make_proxy(full_input, scale)
+            else:
+                # Önceki sonuç zaten önizleme çözünürlüğünde
+                scale = preview_scale(self.original_image.shape, self.proc_label.width(), self.proc_label.height())
+                image = self.processed_image
+            args, kwargs = scale_parameters(func, image, args, kwargs, scale)
+            preview = scale < 1.0
+        elif source == "processed" and self.processed_is_preview:
+            # Önizleme sonucu üzerine tam çözünürlükte işlem: zinciri orijinalden yeniden hesapla
+            func, image, args, kwargs = run_chain, self.original_image, (chain,), {}
+            preview = False
+        else:
+            image = self.original_image if source == "original" else self.processed_image
+            preview = False
+
+        def on_finished(result):
+            if store:
+                self.processed_image = result
+                self.processed_is_preview = preview
+                self.operation_chain = chain
+                self.history.push(result, (preview, chain))
+            if on_result is not None:
+                on_result(result)
+
+        self.start_worker(func, image, *args, message=message, on_result=on_finished, **kwargs)
+
+    def start_worker(self, func, image, *args, message="", on_result=None, **kwargs):
+        # Sonuç önbellekteyse işçi başlatmadan hemen göster
+        key = self.result_cache.make_key(func, image, args, kwargs)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            self.abandon_active_operation()
+            self.show_image(cached, self.proc_label)
+            self.status_bar.showMessage(f"{message} (önbellekten)", 3000)
+            if on_result is not None:
+                on_result(cached)
+            return
+
+        def cache_result(result):
+            self.result_cache.put(key, result)
+            if on_result is not None:
+                on_result(result)
+
+        if self.active_worker is not None:
+            self.active_worker.cancel()
+        self.request_id += 1
+        worker = OperationWorker(self.request_id, func, image, *args, **kwargs)
+        worker.signals.progress.connect(self.on_operation_progress)
+        worker.signals.finished.connect(
+            lambda request_id, result: self.on_operation_finished(
+                request_id, result, message, cache_result
+            )
+        )
+        worker.signals.failed.connect(self.on_operation_failed)
+        self.active_worker = worker
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_btn.show()
+        self.status_bar.showMessage("İşlem sürüyor...")
+        self.operation_started = time.perf_counter()
+        self.thread_pool.start(worker)
+
+    def set_tracing(self, enabled):
+        """Performans kaydını aç/kapat"""
+        instrumentation.enable(enabled)
+        state = "açık" if enabled else "kapalı"
+        self.status_bar.showMessage(f"Performans kaydı {state}.", 3000)
+
+    def export_trace(self):
+        """Kaydedilen işlem sürelerini Chrome trace (JSON) dosyasına yazar"""
+        if not instrumentation.events():
+            self.status_bar.showMessage("Dışa aktarılacak performans kaydı yok.", 3000)
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Performans Kaydını Kaydet", "trace.json", "Chrome Trace (*.json)"
+        )
+        if file_path:
+            try:
+                count = instrumentation.export_chrome_trace(file_path)
+                self.status_bar.showMessage(f"{count} kayıt dışa aktarıldı: {file_path}", 3000)
+            except OSError as e:
+                self.status_bar.showMessage(f"Kaydetme hatası: {str(e)}", 3000)
+
+    def set_preview_mode(self, enabled):
+        """Önizleme modunu aç/kapat"""
+        self.preview_mode = enabled
+        state = "açık" if enabled else "kapalı"
+        self.status_bar.showMessage(f"Önizleme modu {state}.", 3000)
+
+    def render_full_resolution(self, on_result=None):
+        """Önizleme sonucunu üreten işlem zincirini tam çözünürlükte yeniden çalıştırır."""
+        if not self.processed_is_preview:
+            if on_result is not None and self.processed_image is not None:
+                on_result(self.processed_image)
+            return
+        chain = self.operation_chain
+
+        def on_finished(result):
+            self.processed_image = result
+            self.processed_is_preview = False
+            self.history.replace_current(result, (False, chain))
+            if on_result is not None:
+                on_result(result)
+
+        self.start_worker(run_chain, self.original_image, chain,
+                          message="Tam çözünürlükte işlendi.", on_result=on_finished)
+
+    def restore_state(self, state):
+        # Geçmişten gelen (görüntü, (önizleme mi, işlem zinciri)) durumunu uygula
+        image, (is_preview, chain) = state
+        self.processed_image = image
+        self.processed_is_preview = is_preview
+        self.operation_chain = chain
+        if image is None:
+            self.proc_label.clear()
+        else:
+            self.show_image(image, self.proc_label)
+
+    def undo(self):
+        """Son işlemi geri alır"""
+        self.abandon_active_operation()
+        state = self.history.undo()
+        if state is None:
+            self.status_bar.showMessage("Geri alınacak işlem yok.", 3000)
+            return
+        self.restore_state(state)
+        self.status_bar.showMessage("Geri alındı.", 3000)
+
+    def redo(self):
+        """Geri alınan işlemi yineler"""
+        self.abandon_active_operation()
+        state = self.history.redo()
+        if state is None:
+            self.status_bar.showMessage("Yinelenecek işlem yok.", 3000)
+            return
+        self.restore_state(state)
+        self.status_bar.showMessage("Yinelendi.", 3000)
+
+    def is_current_request(self, request_id):
+        """Gelen sinyal en son isteğe mi ait? (Eskimiş sonuçlar yok sayılır.)"""
+        return request_id == self.request_id and self.active_worker is not None
+
+    def finish_operation(self):
+        self.active_worker = None
+        self.progress_bar.hide()
+        self.cancel_btn.hide()
+
+    def on_operation_progress(self, request_id, percent):
+        if self.is_current_request(request_id):
+            self.progress_bar.setValue(percent)
+
+    def on_operation_finished(self, request_id, result, message, on_result):
+        if not self.is_current_request(request_id):
+            return
+        name = self.active_worker.func.__name__
+        self.finish_operation()
+        self.show_image(result, self.proc_label)
+        # İstekten ekranda gösterilene kadar geçen süre (kuyruk ve gösterim dahil)
+        elapsed = time.perf_counter() - self.operation_started
+        if instrumentation.enabled:
+            instrumentation.add_span(name, self.operation_started, elapsed, category='gui')
+        self.status_bar.showMessage(f"{message} ({elapsed * 1000:.0f} ms)", 3000)
+        if on_result is not None:
+            on_result(result)
+
+    def on_operation_failed(self, request_id, error):
+        if not self.is_current_request(request_id):
+            return
+        self.finish_operation()
+        self.status_bar.showMessage(f"Hata oluştu: {error}", 5000)
+
+    def abandon_active_operation(self):
+        # Süren işlemi iptal et ve (gelirse) sonucunu eskimiş say
+        if self.active_worker is None:
+            return False
+        self.active_worker.cancel()
+        self.request_id += 1
+        self.finish_operation()
+        return True
+
+    def cancel_operation(self):
+        """Süren işlemi iptal eder; sonucu gelse bile gösterilmez."""
+        if self.abandon_active_operation():
+            self.status_bar.showMessage("İşlem iptal edildi.", 3000)
+
     def apply_mean_filter(self):
         """
         Ortalama filtresi uygulama fonksiyonu - Gürültüyü azaltmak için kullanılır
         """
         if self.original_image is not None:
-            result = mean_filter(self.original_image, kernel_size=3)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage("Ortalama filtresi uygulandı.", 3000)
+            self.run_operation(mean_filter, kernel_size=3,
+                               message="Ortalama filtresi uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -455,10 +715,8 @@ class MainWindow(QMainWindow):
         Medyan filtresi uygulama fonksiyonu - Tuz ve biber gürültüsünü gidermek için kullanılır
         """
         if self.original_image is not None:
-            result = median_filter(self.original_image, kernel_size=3)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage("Medyan filtresi uygulandı.", 3000)
+            self.run_operation(median_filter, kernel_size=3,
+                               message="Medyan filtresi uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -467,10 +725,7 @@ class MainWindow(QMainWindow):
         Kenar bulma filtresi uygulama fonksiyonu - Görüntüdeki kenarları tespit eder
         """
         if self.original_image is not None:
-            result = edge_detection(self.original_image)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage("Kenar bulma filtresi uygulandı.", 3000)
+            self.run_operation(edge_detection, message="Kenar bulma filtresi uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -479,10 +734,7 @@ class MainWindow(QMainWindow):
         Keskinleştirme filtresi uygulama fonksiyonu - Görüntüyü daha net hale getirir
         """
         if self.original_image is not None:
-            result = sharpening_filter(self.original_image)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage("Keskinleştirme filtresi uygulandı.", 3000)
+            self.run_operation(sharpening_filter, message="Keskinleştirme filtresi uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -491,10 +743,7 @@ class MainWindow(QMainWindow):
         Yumuşatma filtresi uygulama fonksiyonu - Görüntüyü yumuşatır
         """
         if self.original_image is not None:
-            result = smoothing_filter(self.original_image)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage("Yumuşatma filtresi uygulandı.", 3000)
+            self.run_operation(smoothing_filter, message="Yumuşatma filtresi uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -513,11 +762,10 @@ class MainWindow(QMainWindow):
         Histogram eşitleme fonksiyonu - Görüntünün kontrastını artırır
         """
         if self.original_image is not None:
-            eq_img = histogram_equalization(self.original_image)
-            self.processed_image = eq_img
-            self.show_image(eq_img, self.proc_label)
-            show_histogram(eq_img, "Eşitlenmiş Görüntü Histogramı")
-            self.status_bar.showMessage("Histogram eşitleme uygulandı.", 3000)
+            self.run_operation(
+                histogram_equalization, message="Histogram eşitleme uygulandı.",
+                on_result=lambda eq_img: show_histogram(eq_img, "Eşitlenmiş Görüntü Histogramı")
+            )
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -526,10 +774,8 @@ class MainWindow(QMainWindow):
         Görüntüyü döndürme fonksiyonu - Belirtilen açı kadar döndürür
         """
         if self.original_image is not None:
-            rotated = rotate_image(self.original_image, angle)
-            self.processed_image = rotated
-            self.show_image(rotated, self.proc_label)
-            self.status_bar.showMessage(f"{angle}° döndürme uygulandı.", 3000)
+            self.run_operation(rotate_image, angle,
+                               message=f"{angle}° döndürme uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -538,10 +784,8 @@ class MainWindow(QMainWindow):
         Görüntüyü aynalama fonksiyonu - Yatay veya dikey aynalama yapar
         """
         if self.original_image is not None:
-            flipped = flip_image(self.original_image, mode)
-            self.processed_image = flipped
-            self.show_image(flipped, self.proc_label)
-            self.status_bar.showMessage(f"{'Yatay' if mode=='horizontal' else 'Dikey'} aynalama uygulandı.", 3000)
+            self.run_operation(flip_image, mode,
+                               message=f"{'Yatay' if mode=='horizontal' else 'Dikey'} aynalama uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -553,10 +797,8 @@ class MainWindow(QMainWindow):
             from PyQt5.QtWidgets import QInputDialog
             value, ok = QInputDialog.getInt(self, "Manuel Eşikleme", "Eşik değeri (0-255):", 128, 0, 255, 1)
             if ok:
-                binary = manual_threshold(self.original_image, value)
-                self.processed_image = binary
-                self.show_image(binary, self.proc_label)
-                self.status_bar.showMessage(f"Manuel eşikleme uygulandı. Eşik: {value}", 3000)
+                self.run_operation(manual_threshold, value,
+                                   message=f"Manuel eşikleme uygulandı. Eşik: {value}")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -565,10 +807,7 @@ class MainWindow(QMainWindow):
         OTSU eşikleme fonksiyonu - Otomatik olarak en uygun eşik değerini belirler
         """
         if self.original_image is not None:
-            binary = otsu_threshold(self.original_image)
-            self.processed_image = binary
-            self.show_image(binary, self.proc_label)
-            self.status_bar.showMessage("OTSU eşikleme uygulandı.", 3000)
+            self.run_operation(otsu_threshold, message="OTSU eşikleme uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -577,10 +816,7 @@ class MainWindow(QMainWindow):
         Kapur eşikleme fonksiyonu - Entropi tabanlı otomatik eşikleme yapar
         """
         if self.original_image is not None:
-            binary = kapur_threshold(self.original_image)
-            self.processed_image = binary
-            self.show_image(binary, self.proc_label)
-            self.status_bar.showMessage("Kapur eşikleme uygulandı.", 3000)
+            self.run_operation(kapur_threshold, message="Kapur eşikleme uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -601,12 +837,19 @@ class MainWindow(QMainWindow):
             )
             if not ok2:
                 return
+
+            # Blok eşikleri arasında ara değerleme (blok sınırlarında iz bırakmaz)
+            edges = ["Yumuşak (ara değerli)", "Keskin (blok blok)"]
+            edge, ok3 = QInputDialog.getItem(
+                self, "Blok Geçişleri", "Blok eşikleri:", edges, 0, False
+            )
+            if not ok3:
+                return
+            interpolate = edge == edges[0]
                 
             # Yerel eşikleme uygula
-            result = local_threshold(self.original_image, block_size, c_value)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage(f"Yerel eşikleme uygulandı. Blok: {block_size}x{block_size}, C: {c_value}", 3000)
+            self.run_operation(local_threshold, block_size, c_value, interpolate=interpolate,
+                               message=f"Yerel eşikleme uygulandı. Blok: {block_size}x{block_size}, C: {c_value}")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
             
@@ -615,9 +858,18 @@ class MainWindow(QMainWindow):
         Adaptif yerel eşikleme fonksiyonu - Piksel bazlı adaptif eşikleme yapar
         """
         if self.original_image is not None:
-            # Kullanıcıdan parametreleri al
+            # Eşik yöntemi: pencere ortalaması, Niblack veya Sauvola
+            methods = {"Ortalama": "mean", "Niblack": "niblack", "Sauvola (belge)": "sauvola"}
+            method_name, ok0 = QInputDialog.getItem(
+                self, "Yöntem", "Eşik yöntemi:", list(methods), 0, False
+            )
+            if not ok0:
+                return
+            method = methods[method_name]
+
+            # Kullanıcıdan parametreleri al (maliyet pencere boyutundan bağımsız)
             window_size, ok1 = QInputDialog.getInt(
-                self, "Pencere Boyutu", "Pencere boyutu (tek sayı, 3-101):", 51, 3, 101, 2
+                self, "Pencere Boyutu", "Pencere boyutu (tek sayı, 3-301):", 51, 3, 301, 2
             )
             # Tek sayı yap
             if window_size % 2 == 0:
@@ -627,16 +879,15 @@ class MainWindow(QMainWindow):
                 return
                 
             c_value, ok2 = QInputDialog.getInt(
-                self, "C Değeri", "C değeri (0-20):", 10, 0, 20, 1
+                self, "C Değeri", "C değeri (0-20):", 10 if method == "mean" else 0, 0, 20, 1
             )
             if not ok2:
                 return
                 
             # Adaptif yerel eşikleme uygula
-            result = adaptive_local_threshold(self.original_image, window_size, c_value)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage(f"Adaptif yerel eşikleme uygulandı. Pencere: {window_size}x{window_size}, C: {c_value}", 3000)
+            self.run_operation(adaptive_local_threshold, window_size, c_value, method=method,
+                               message=f"Adaptif yerel eşikleme ({method_name}) uygulandı. "
+                                       f"Pencere: {window_size}x{window_size}, C: {c_value}")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
 
@@ -645,10 +896,8 @@ class MainWindow(QMainWindow):
         Dilation (genişletme) fonksiyonu - İkili görüntüdeki nesneleri genişletir
         """
         if self.processed_image is not None:
-            dilated = dilation(self.processed_image, kernel_size=3)
-            self.processed_image = dilated
-            self.show_image(dilated, self.proc_label)
-            self.status_bar.showMessage("Dilation uygulandı.", 3000)
+            self.run_operation(dilation, source="processed", kernel_size=3,
+                               message="Dilation uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir ikili görüntü elde edin!", 3000)
 
@@ -657,22 +906,18 @@ class MainWindow(QMainWindow):
         Erosion (aşındırma) fonksiyonu - İkili görüntüdeki nesneleri küçültür
         """
         if self.processed_image is not None:
-            eroded = erosion(self.processed_image, kernel_size=3)
-            self.processed_image = eroded
-            self.show_image(eroded, self.proc_label)
-            self.status_bar.showMessage("Erosion uygulandı.", 3000)
+            self.run_operation(erosion, source="processed", kernel_size=3,
+                               message="Erosion uygulandı.")
         else:
             self.status_bar.showMessage("Önce bir ikili görüntü elde edin!", 3000)
 
     def apply_center_of_mass(self):
         """
-        Ağırlık merkezi hesaplama fonksiyonu - İkili görüntüdeki nesnenin merkezini bulur
+        Ağırlık merkezi hesaplama fonksiyonu - İkili görüntüdeki her nesnenin merkezini bulur
         """
         if self.processed_image is not None:
-            center = center_of_mass(self.processed_image)
-            marked = mark_center_of_mass(self.processed_image, center)
-            self.show_image(marked, self.proc_label)
-            self.status_bar.showMessage("Ağırlık merkezi işaretlendi.", 3000)
+            self.run_operation(mark_center, source="processed", store=False,
+                               message="Nesnelerin ağırlık merkezleri işaretlendi.")
         else:
             self.status_bar.showMessage("Önce bir ikili görüntü elde edin!", 3000)
 
@@ -681,12 +926,8 @@ class MainWindow(QMainWindow):
         İskelet çıkarma fonksiyonu - İkili görüntüdeki nesnenin iskeletini çıkarır
         """
         if self.processed_image is not None:
-            # Önce resmi küçültün
-            resized = cv2.resize(self.processed_image, (800, 600))
-            # Sonra iskelet çıkarın
-            skeleton = zhang_suen_thinning(resized)
-            self.show_image(skeleton, self.proc_label)
-            self.status_bar.showMessage("İskelet çıkarıldı.", 3000)
+            self.run_operation(zhang_suen_thinning, source="processed", store=False,
+                               message="İskelet çıkarıldı.")
         else:
             self.status_bar.showMessage("Önce bir ikili görüntü elde edin!", 3000)
 
@@ -707,7 +948,8 @@ class MainWindow(QMainWindow):
         if sender == self.orig_label:
             save_action.triggered.connect(lambda: self.save_image(self.original_image))
         else:
-            save_action.triggered.connect(lambda: self.save_image(self.processed_image))
+            # Önizleme sonucu kaydedilmeden önce tam çözünürlükte yeniden hesaplanır
+            save_action.triggered.connect(lambda: self.render_full_resolution(on_result=self.save_image))
             
         # Menüyü göster
         context_menu.exec_(QCursor.pos())
@@ -736,17 +978,8 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
-                # Görüntüyü doğru formatta kaydet
-                if len(image.shape) == 3:
-                    # BGR'dan RGB'ye çevir
-                    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                    height, width, channel = rgb_image.shape
-                    bytes_per_line = channel * width
-                    qt_image = QImage(rgb_image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-                else:
-                    # Gri tonlamalı görüntü
-                    height, width = image.shape
-                    qt_image = QImage(image.data, width, height, width, QImage.Format_Grayscale8)
+                # Görüntü kopyalanmadan QImage olarak sarılır (BGR/gri düzen Qt'de korunur)
+                qt_image = numpy_to_qimage(image)
                 
                 # Görüntüyü kaydet
                 if qt_image.save(file_path):
@@ -776,10 +1009,8 @@ class MainWindow(QMainWindow):
                 return
                 
             # Kontrast germe uygula
-            result = contrast_stretching(self.original_image, min_out, max_out)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage(f"Kontrast germe uygulandı. Min: {min_out}, Max: {max_out}", 3000)
+            self.run_operation(contrast_stretching, min_out, max_out,
+                               message=f"Kontrast germe uygulandı. Min: {min_out}, Max: {max_out}")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
     
@@ -793,9 +1024,7 @@ class MainWindow(QMainWindow):
                 return
                 
             # Kontrast yayma uygula
-            result = contrast_spreading(self.original_image, percentage)
-            self.processed_image = result
-            self.show_image(result, self.proc_label)
-            self.status_bar.showMessage(f"Kontrast yayma uygulandı. Kırpma yüzdesi: %{percentage}", 3000)
+            self.run_operation(contrast_spreading, percentage,
+                               message=f"Kontrast yayma uygulandı. Kırpma yüzdesi: %{percentage}")
         else:
             self.status_bar.showMessage("Önce bir resim yükleyin!", 3000)
\ No newline at end of file
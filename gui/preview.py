@@ -0,0 +1,41 @@
+import inspect
+
+import cv2
+
+from processing.pipeline import Pipeline
+
+# Önizlemede görüntüyle birlikte küçültülen (piksel cinsinden) parametreler
+_SIZE_PARAMETERS = ('kernel_size', 'window_size', 'block_size')
+
+def preview_scale(shape, target_width, target_height):
+    """Görüntüyü hedef alana sığdıran küçültme oranı (büyütme yapılmaz)."""
+    h, w = shape[:2]
+    return min(1.0, target_width / w, target_height / h)
+
+def make_proxy(image, scale):
+    """Görüntünün ölçeklenmiş önizleme kopyası (scale >= 1 ise görüntünün kendisi)."""
+    if scale >= 1.0:
+        return image
+    width = max(1, int(round(image.shape[1] * scale)))
+    height = max(1, int(round(image.shape[0] * scale)))
+    return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+
+def scale_parameters(func, image, args, kwargs, scale):
+    """
+    Kernel/pencere/blok boyutlarını önizleme ölçeğine göre küçültür.
+    Tek sayı olan boyutlar tek kalır. (args, kwargs) döndürür.
+    """
+    bound = inspect.signature(func).bind(image, *args, **kwargs)
+    bound.apply_defaults()
+    for name in _SIZE_PARAMETERS:
+        value = bound.arguments.get(name)
+        if isinstance(value, int):
+            scaled = max(1, int(round(value * scale)))
+            if value % 2 == 1 and scaled % 2 == 0:
+                scaled += 1
+            bound.arguments[name] = scaled
+    return bound.args[1:], bound.kwargs
+
+def run_chain(image, steps):
+    """(func, args, kwargs) adımlarını sırayla uygular; tam çözünürlüklü yeniden hesap için."""
+    return Pipeline(steps).run(image)
@@ -0,0 +1,68 @@
+import numpy as np
+from PyQt5 import sip
+from PyQt5.QtGui import QImage
+
+# Kanal sayısı -> NumPy (OpenCV BGR) bellek düzenini doğrudan okuyabilen QImage formatı
+_FORMATS = {
+    1: QImage.Format_Grayscale8,
+    3: QImage.Format_BGR888,
+    4: QImage.Format_ARGB32,   # küçük endian'da bellekte B, G, R, A sırası
+}
+
+def _aligned_copy(image):
+    # Satırları 4 bayta hizalanmış tek kopya (Qt tarama satırlarının 32 bit hizalı olmasını bekler)
+    height, width = image.shape[:2]
+    row_bytes = width * (1 if image.ndim == 2 else image.shape[2])
+    buffer = np.empty((height, (row_bytes + 3) // 4 * 4), dtype=np.uint8)
+    view = buffer[:, :row_bytes].reshape(image.shape)
+    view[...] = image
+    return view
+
+def numpy_to_qimage(image):
+    """
+    uint8 NumPy görüntüsünü kopyalamadan QImage olarak sarar.
+    Satır içindeki pikseller bitişik ve satırlar 4 bayta hizalıysa (ör. C-sıralı
+    diziler, satır kırpmaları) veri doğrudan kullanılır; np.rot90 gibi bitişik
+    olmayan görünümlerde ya da hizasız satırlarda tek bir kopya alınır.
+    Dizi, QImage nesnesi yaşadığı sürece ona bağlı tutulur.
+    """
+    if image.dtype != np.uint8:
+        raise ValueError("Yalnızca uint8 görüntüler gösterilebilir.")
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    if channels not in _FORMATS:
+        raise ValueError(f"{channels} kanallı görüntü desteklenmiyor.")
+    pixel_strides = (1,) if image.ndim == 2 else (channels, 1)
+    if (image.strides[1:] != pixel_strides or image.strides[0] <= 0 or image.strides[0] % 4
+            or image.__array_interface__['data'][0] % 4):
+        image = _aligned_copy(image)
+    height, width = image.shape[:2]
+    qimage = QImage(sip.voidptr(image.ctypes.data), width, height, image.strides[0], _FORMATS[channels])
+    # QImage veriyi kopyalamadığı için dizi QImage'la birlikte yaşamalı
+    qimage._numpy_buffer = image
+    return qimage
+
+class _QImageBuffer:
+    # QImage'ın belleğini NumPy'a açan ve QImage'ı canlı tutan sarmalayıcı
+    def __init__(self, qimage, shape, strides):
+        self.qimage = qimage
+        self.__array_interface__ = {
+            'shape': shape,
+            'typestr': '|u1',
+            'data': (int(qimage.bits()), False),
+            'strides': strides,
+            'version': 3,
+        }
+
+def qimage_to_numpy(qimage):
+    """
+    QImage'ı BGR sıralı (yükseklik, genişlik, 3) uint8 diziye çevirir.
+    Format dönüşümü Qt tarafında yapılır; satır sonlarında dolgu yoksa dizi bu
+    belleği kopyalamadan kullanır, varsa tek bir kopya alınır.
+    """
+    converted = qimage.convertToFormat(QImage.Format_BGR888)
+    height, width = converted.height(), converted.width()
+    bytes_per_line = converted.bytesPerLine()
+    array = np.asarray(_QImageBuffer(converted, (height, width, 3), (bytes_per_line, 3, 1)))
+    if bytes_per_line != width * 3:
+        array = np.ascontiguousarray(array)
+    return array
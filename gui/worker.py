@@ -0,0 +1,68 @@
+import threading
+from functools import partial
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from processing import instrumentation
+from processing.tiling import OperationCancelled, parallel_apply, supports_tiling
+
+class WorkerSignals(QObject):
+    """
+    Arka plan işçisinin GUI iş parçacığına gönderdiği sinyaller.
+    Her sinyal isteğin kimliğini taşır; böylece eskimiş sonuçlar ayıklanabilir.
+    """
+    progress = pyqtSignal(int, int)        # istek kimliği, yüzde
+    finished = pyqtSignal(int, object)     # istek kimliği, sonuç dizisi
+    failed = pyqtSignal(int, str)          # istek kimliği, hata mesajı
+    cancelled = pyqtSignal(int)            # istek kimliği
+
+class OperationWorker(QRunnable):
+    """
+    Bir processing/* fonksiyonunu QThreadPool üzerinde çalıştırır.
+    Bantlara bölünebilen işlemler bant bant ilerler: her bantta ilerleme bildirilir
+    ve iptal isteği kontrol edilir. Diğer işlemler tek parça çalışır; iptal
+    edildiklerinde sonuçları bildirilmez.
+    """
+
+    def __init__(self, request_id, func, image, *args, **kwargs):
+        super().__init__()
+        self.request_id = request_id
+        self.func = func
+        self.image = image
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def _report_progress(self, done, total):
+        self.signals.progress.emit(self.request_id, int(100 * done / total))
+
+    def run(self):
+        try:
+            if self.is_cancelled():
+                raise OperationCancelled()
+            self.signals.progress.emit(self.request_id, 0)
+            if supports_tiling(self.func, *self.args, **self.kwargs):
+                result = instrumentation.call_named(
+                    self.func.__name__, partial(parallel_apply, self.func), self.image, *self.args,
+                    progress=self._report_progress,
+                    should_cancel=self.is_cancelled,
+                    **self.kwargs
+                )
+            else:
+                result = instrumentation.call(self.func, self.image, *self.args, **self.kwargs)
+            if self.is_cancelled():
+                raise OperationCancelled()
+        except OperationCancelled:
+            self.signals.cancelled.emit(self.request_id)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.progress.emit(self.request_id, 100)
+            self.signals.finished.emit(self.request_id, result)
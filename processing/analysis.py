@@ -1,35 +1,127 @@
 import numpy as np
 import cv2
+from processing.binary import BinaryMask
+from processing.labeling import Components
+
+# İşaretleme dairesinin varsayılan yarıçapı (piksel)
+MARKER_RADIUS = 8
 
 def center_of_mass(binary_image):
-    # Beyaz piksellerin ağırlık merkezi
+    # Beyaz piksellerin ağırlık merkezi (tüm nesneler tek bir nesne sayılır)
+    if isinstance(binary_image, BinaryMask):
+        return binary_image.center_of_mass()
     if len(binary_image.shape) == 3:
         binary_image = cv2.cvtColor(binary_image, cv2.COLOR_BGR2GRAY)
-    binary = (binary_image > 0).astype(np.uint8)
-    coords = np.column_stack(np.where(binary > 0))
-    if coords.size == 0:
+    # binaryImage=True: sıfırdan büyük pikseller 1 sayılır; koordinat dizisi oluşturulmaz
+    moments = cv2.moments(binary_image, binaryImage=True)
+    if moments['m00'] == 0:
         return None
-    y, x = coords.mean(axis=0)
-    return int(x), int(y)
+    return int(moments['m10'] / moments['m00']), int(moments['m01'] / moments['m00'])
+
+def _disk_offsets(radius):
+    # cv2.circle'ın dolu dairesiyle aynı piksellerin merkeze göre (dy, dx) konumları
+    size = 2 * radius + 1
+    stamp = np.zeros((size, size), dtype=np.uint8)
+    cv2.circle(stamp, (radius, radius), radius, 1, -1)
+    dy, dx = np.nonzero(stamp)
+    return dy - radius, dx - radius
 
-def mark_center_of_mass(image, center):
-    # Ağırlık merkezini kırmızı bir daire ile işaretle
+def mark_center_of_mass(image, center, radius=MARKER_RADIUS):
+    """
+    Ağırlık merkezlerini kırmızı dolu dairelerle işaretler.
+    center: tek (x, y) noktası, N x 2 (x, y) dizisi, Components ya da None.
+    Tüm daireler tek bir dizi atamasıyla çizilir (nesne sayısından bağımsız tek adım).
+    """
     marked = image.copy()
     if len(marked.shape) == 2:
         marked = cv2.cvtColor(marked, cv2.COLOR_GRAY2BGR)
-    if center is not None:
-        cv2.circle(marked, center, 8, (0, 0, 255), -1)
+    if center is None:
+        return marked
+    if isinstance(center, Components):
+        center = center.centers()
+    centers = np.asarray(center, dtype=np.int64).reshape(-1, 2)
+    if len(centers) == 0:
+        return marked
+    dy, dx = _disk_offsets(radius)
+    ys = (centers[:, 1, None] + dy).ravel()
+    xs = (centers[:, 0, None] + dx).ravel()
+    h, w = marked.shape[:2]
+    inside = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    marked[ys[inside], xs[inside]] = (0, 0, 255)
     return marked
 
+def _zhang_suen_luts():
+    # 8 komşunun paketlenmiş kodu (bit 0: P2 kuzey, saat yönünde bit 7: P9 kuzeybatı) için
+    # iki alt adımın silme kararları
+    codes = np.arange(256)
+    p = [(codes >> bit) & 1 for bit in range(8)]
+    p2, p3, p4, p5, p6, p7, p8, p9 = p
+    neighbors = sum(p)
+    # P2, P3, ..., P9, P2 dizisindeki 0 -> 1 geçişleri
+    transitions = sum((p[k] == 0) & (p[(k + 1) % 8] == 1) for k in range(8))
+    common = (neighbors >= 2) & (neighbors <= 6) & (transitions == 1)
+    first = common & (p2 * p4 * p6 == 0) & (p4 * p6 * p8 == 0)
+    second = common & (p2 * p4 * p8 == 0) & (p2 * p6 * p8 == 0)
+    return first, second
+
+_ZHANG_SUEN_LUTS = _zhang_suen_luts()
+
+def _neighbor_offsets(width):
+    # Düz dizide P2..P9 komşularının konum farkları (LUT bit sırasıyla)
+    return np.array([-width, -width + 1, 1, width + 1, width, width - 1, -1, -width - 1], dtype=np.intp)
+
+def _unique_indices(indices, stamp):
+    # Sıralamadan tekilleştirme: her konuma dizideki son sırası yazılır, yalnızca o sıra tutulur
+    order = np.arange(indices.size, dtype=stamp.dtype)
+    stamp[indices] = order
+    return indices[stamp[indices] == order]
+
 def zhang_suen_thinning(binary_image):
+    """
+    Zhang-Suen iskelet çıkarma (cv2.ximgproc.thinning ile aynı sonuç, opencv-contrib gerekmez).
+    Her alt adımda yalnızca etkin sınırdaki pikseller incelenir: başta nesne sınırı,
+    sonra yalnızca son iki adımda silinen piksellerin komşuları. Komşuluk 8 bitlik
+    koda paketlenir ve silme kararı 256 girişli tablodan okunur.
+    Görüntü kenarındaki pikseller (cv2'de olduğu gibi) değişmez.
+    """
     # Gri veya renkli ise binary'ye çevir
     if len(binary_image.shape) == 3:
         binary_image = cv2.cvtColor(binary_image, cv2.COLOR_BGR2GRAY)
     
-    # Binary görüntüyü hazırla
-    _, binary = cv2.threshold(binary_image, 127, 255, cv2.THRESH_BINARY)
-    
-    # OpenCV'nin iskelet çıkarma fonksiyonu
-    skeleton = cv2.ximgproc.thinning(binary)
-    
-    return skeleton
\ No newline at end of file
+    # Binary görüntüyü hazırla (0/1)
+    image = (binary_image > 127).astype(np.uint8)
+    h, w = image.shape
+    if h < 3 or w < 3:
+        return image * np.uint8(255)
+    flat = image.ravel()
+    offsets = _neighbor_offsets(w)
+    interior = np.zeros((h, w), dtype=bool)
+    interior[1:-1, 1:-1] = True
+    interior = interior.ravel()
+
+    # Başlangıç sınırı: en az bir komşusu arka plan olan iç ön plan pikselleri
+    eroded = cv2.erode(image, np.ones((3, 3), np.uint8))
+    frontier = np.flatnonzero((flat > eroded.ravel()) & interior)
+    # Bir piksel, aynı alt adım tablosuyla son incelenmesinden sonra komşuluğu
+    # değiştiyse yeniden incelenir; bu yüzden son iki adımın değişimleri birleştirilir
+    touched = [frontier, frontier]
+    # Aday dizisi en fazla iki adımın komşuları kadar (2 x 8 x piksel sayısı) uzayabilir
+    stamp = np.empty(h * w, dtype=np.int32 if 16 * h * w < 2**31 else np.int64)
+    step = 0
+    while True:
+        candidates = np.concatenate(touched)
+        candidates = _unique_indices(candidates[flat[candidates] == 1], stamp)
+        if candidates.size == 0:
+            break
+        codes = np.zeros(candidates.size, dtype=np.uint8)
+        for bit, offset in enumerate(offsets):
+            codes |= flat[candidates + offset] << np.uint8(bit)
+        deleted = candidates[_ZHANG_SUEN_LUTS[step % 2][codes]]
+        # Kararlar tüm adaylar için önce hesaplanır, sonra birlikte uygulanır
+        flat[deleted] = 0
+        neighbors = (deleted[:, None] + offsets).ravel()
+        neighbors = neighbors[interior[neighbors] & (flat[neighbors] == 1)]
+        touched = [touched[1], neighbors]
+        step += 1
+
+    return image * np.uint8(255)
@@ -0,0 +1,171 @@
+import numpy as np
+import cv2
+
+# Modül olarak içe aktarılır: morphology de bu modülü içe aktarır (döngüsel içe aktarma)
+from processing import morphology
+
+# Bayt değeri başına bit sayısı ve (en anlamlı bit 0 olmak üzere) bit konumlarının toplamı
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+_BIT_POSITION_SUM = np.array(
+    [sum(7 - b for b in range(8) if (i >> b) & 1) for i in range(256)], dtype=np.uint16
+)
+
+_WORD_BITS = 64
+
+def _shift_columns(words, n):
+    """Sonuçtaki x. bit, girişteki (x + n). bittir; dışarıda kalan bitler sıfırdır."""
+    if n == 0:
+        return words
+    n_words = words.shape[1]
+    q, r = divmod(abs(n), _WORD_BITS)
+    out = np.zeros_like(words)
+    if q >= n_words:
+        return out
+    r = np.uint64(r)
+    carry = np.uint64(_WORD_BITS) - r
+    if n > 0:
+        out[:, :n_words - q] = words[:, q:]
+        if r:
+            shifted = out << r
+            shifted[:, :-1] |= out[:, 1:] >> carry
+            out = shifted
+    else:
+        out[:, q:] = words[:, :n_words - q]
+        if r:
+            shifted = out >> r
+            shifted[:, 1:] |= out[:, :-1] << carry
+            out = shifted
+    return out
+
+def _shift_rows(words, n):
+    """Sonuçtaki y. satır, girişteki (y + n). satırdır; dışarıda kalan satırlar sıfırdır."""
+    if n == 0:
+        return words
+    out = np.zeros_like(words)
+    if abs(n) >= words.shape[0]:
+        return out
+    if n > 0:
+        out[:-n] = words[n:]
+    else:
+        out[-n:] = words[:n]
+    return out
+
+def _one_sided_or(words, length, shift, direction):
+    # [x, x + length) (direction=1) veya (x - length, x] (direction=-1) aralığında OR;
+    # aralık ikiye katlanarak büyütüldüğü için O(log length) kelime işlemi
+    acc = words
+    span = 1
+    while span * 2 <= length:
+        acc = acc | shift(acc, direction * span)
+        span *= 2
+    if span < length:
+        acc = acc | shift(acc, direction * (length - span))
+    return acc
+
+def _window_or(words, k, shift):
+    """[x - k//2, x - k//2 + k) penceresinde OR (kenar dışı sıfır)."""
+    pad = k // 2
+    right = _one_sided_or(words, k - pad, shift, 1)
+    left = _one_sided_or(words, pad + 1, shift, -1)
+    return left | right
+
+class BinaryMask:
+    """
+    Bit düzeyinde paketlenmiş ikili görüntü (piksel başına 1 bit, uint8'e göre 8 kat az bellek).
+    Her satır 64 bitlik kelimelere paketlenir; satırdaki ilk piksel kelimenin en anlamlı bitidir.
+    Son kelimede görüntü genişliğini aşan bitler her zaman sıfır tutulur.
+    """
+
+    def __init__(self, words, shape):
+        self.words = words
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    @classmethod
+    def from_bool(cls, mask):
+        """Boolean diziden paketlenmiş maske oluşturur."""
+        h, w = mask.shape
+        n_words = max(1, -(-w // _WORD_BITS))
+        n_bytes = -(-w // 8)
+        packed = np.zeros((h, n_words * 8), dtype=np.uint8)
+        packed[:, :n_bytes] = np.packbits(mask, axis=1)
+        words = packed.view('>u8').astype(np.uint64)
+        return cls(words, (h, w))
+
+    @classmethod
+    def from_image(cls, image):
+        """0/255 (veya sıfırdan büyük değerli) uint8 görüntüden maske oluşturur."""
+        if len(image.shape) == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return cls.from_bool(image > 0)
+
+    def _bytes(self):
+        # Kelimeleri bellek sırasına göre baytlara aç (ilk piksel ilk baytın en anlamlı biti)
+        h = self.shape[0]
+        return self.words.astype('>u8').view(np.uint8).reshape(h, -1)
+
+    def to_bool(self):
+        return np.unpackbits(self._bytes(), axis=1, count=self.shape[1]).astype(bool)
+
+    def to_image(self):
+        """Arayüzün gösterdiği 0/255 uint8 biçimine dönüştürür."""
+        image = np.unpackbits(self._bytes(), axis=1, count=self.shape[1])
+        image *= 255
+        return image
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
+
+    def _tail_mask(self):
+        # Son kelimede genişliği aşan bitleri sıfırlamak için maske
+        mask = np.full(self.words.shape[1], np.uint64(0xFFFFFFFFFFFFFFFF), dtype=np.uint64)
+        extra = self.words.shape[1] * _WORD_BITS - self.shape[1]
+        if extra:
+            mask[-1] = np.uint64(0xFFFFFFFFFFFFFFFF) << np.uint64(extra)
+        return mask
+
+    def _wrap(self, words):
+        return BinaryMask(words & self._tail_mask(), self.shape)
+
+    def __and__(self, other):
+        return BinaryMask(self.words & other.words, self.shape)
+
+    def __or__(self, other):
+        return BinaryMask(self.words | other.words, self.shape)
+
+    def __invert__(self):
+        return self._wrap(~self.words)
+
+    def dilate(self, kernel_size=3):
+        """Dikdörtgen yapı elemanıyla dilation; görüntü dışı 0 kabul edilir."""
+        kh, kw = morphology._kernel_shape(kernel_size)
+        words = _window_or(self.words, kw, _shift_columns)
+        # Sağa kayan bitler genişlik dışına taşmış olabilir; satır geçişinden önce temizle
+        words &= self._tail_mask()
+        words = _window_or(words, kh, _shift_rows)
+        return BinaryMask(words, self.shape)
+
+    def erode(self, kernel_size=3):
+        """Dikdörtgen yapı elemanıyla erosion; görüntü dışı 1 (255) kabul edilir."""
+        return ~((~self).dilate(kernel_size))
+
+    def moments(self):
+        """Popcount ile (m00, m10, m01): piksel sayısı, x toplamı, y toplamı."""
+        data = self._bytes()
+        counts = _POPCOUNT[data]
+        row_counts = counts.sum(axis=1, dtype=np.int64)
+        col_counts = counts.sum(axis=0, dtype=np.int64)
+        m00 = int(row_counts.sum())
+        m01 = int(np.dot(row_counts, np.arange(len(row_counts), dtype=np.int64)))
+        byte_offsets = 8 * np.arange(len(col_counts), dtype=np.int64)
+        m10 = int(np.dot(col_counts, byte_offsets)) + int(_BIT_POSITION_SUM[data].sum(dtype=np.int64))
+        return m00, m10, m01
+
+    def count(self):
+        return self.moments()[0]
+
+    def center_of_mass(self):
+        m00, m10, m01 = self.moments()
+        if m00 == 0:
+            return None
+        return int(m10 / m00), int(m01 / m00)
@@ -0,0 +1,102 @@
+import hashlib
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+# Varsayılan önbellek bütçesi (bayt)
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+# get içinde "kayıt yok" işareti (saklanan None sonucundan ayırmak için)
+_MISSING = object()
+
+def content_hash(image):
+    """Dizinin içeriği, şekli ve veri tipinden türetilen hızlı özet (blake2b, 128 bit)."""
+    data = np.ascontiguousarray(image)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str((data.shape, data.dtype.str)).encode())
+    digest.update(memoryview(data).cast('B'))
+    return digest.hexdigest()
+
+def _freeze(value):
+    # Parametreleri sözlük anahtarı olarak kullanılabilir hale getir
+    if isinstance(value, np.ndarray):
+        return ('ndarray', content_hash(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if callable(value):
+        return (getattr(value, '__module__', None), getattr(value, '__qualname__', repr(value)))
+    return value
+
+class ResultCache:
+    """
+    İşlem sonuçları için LRU önbellek. Anahtar: giriş görüntüsünün içerik özeti,
+    işlemin adı ve parametreleri. Toplam sonuç boyutu max_bytes'ı aşınca en uzun
+    süredir kullanılmayan sonuçlar atılır.
+    Dönen diziler önbellekle paylaşılır; yerinde değiştirilmemelidir.
+    Kayıtlar (sonuç, boyut) çiftidir; nbytes özelliği olmayan sonuçların boyutu 0 sayılır.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._image_keys = {}
+
+    def image_key(self, image):
+        """
+        Görüntünün içerik özeti. Aynı dizi nesnesi için özet bir kez hesaplanır
+        (dizi bellekten silinince kaydı da silinir).
+        """
+        memo = self._image_keys.get(id(image))
+        if memo is not None and memo[0]() is image:
+            return memo[1]
+        key = content_hash(image)
+        image_id = id(image)
+        ref = weakref.ref(image, lambda _: self._image_keys.pop(image_id, None))
+        self._image_keys[image_id] = (ref, key)
+        return key
+
+    def make_key(self, func, image, args=(), kwargs=None):
+        return (self.image_key(image), _freeze(func), _freeze(args), _freeze(kwargs or {}))
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, result):
+        size = getattr(result, 'nbytes', 0)
+        # Aynı anahtarın eski sonucu her durumda atılır; yeni sonuç sığmasa bile
+        # sonraki get eski sonucu döndürmemeli
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (result, size)
+        self.current_bytes += size
+        self._evict()
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,8 +1,10 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import cv2
 
 def show_histogram(image, title="Histogram"):
+    # pyplot burada yüklenir: arayüzsüz (komut satırı) kullanımda grafik arka ucu seçilmez
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
     
     if len(image.shape) == 3:  # RGB image
@@ -37,6 +39,8 @@ def contrast_stretching(image, min_out=0, max_out=255):
     """
     Kontrast germe - resimdeki piksel değerlerini belirli bir aralığa yayar.
     Elle yazılmış uygulama, hazır kütüphane fonksiyonu kullanılmamıştır.
+    uint8 görüntülerde her kanal için 256 elemanlı tablo histogramdan hesaplanır
+    ve tüm kanallara tek bir cv2.LUT çağrısıyla uygulanır (split/merge yok).
     
     Parametreler:
     - image: Giriş görüntüsü
@@ -46,24 +50,22 @@ def contrast_stretching(image, min_out=0, max_out=255):
     Dönüş:
     - stretched_image: Kontrast genişletilmiş görüntü
     """
-    # Çok kanallı görüntü için
-    if len(image.shape) == 3:
-        # BGR kanallarını ayır
-        b, g, r = cv2.split(image)
-        
-        # Her kanalı ayrı ayrı işle
-        b_stretched = contrast_stretch_channel(b, min_out, max_out)
-        g_stretched = contrast_stretch_channel(g, min_out, max_out)
-        r_stretched = contrast_stretch_channel(r, min_out, max_out)
-        
-        # Kanalları tekrar birleştir
-        return cv2.merge([b_stretched, g_stretched, r_stretched])
-    else:
-        # Tek kanallı (gri tonlamalı) görüntü için
+    if image.dtype != np.uint8:
+        if len(image.shape) == 3:
+            channels = [contrast_stretch_channel(image[:, :, c], min_out, max_out)
+                        for c in range(image.shape[2])]
+            return np.dstack(channels)
         return contrast_stretch_channel(image, min_out, max_out)
+    luts = np.stack([contrast_stretch_lut(h, min_out, max_out) for h in channel_histograms(image)])
+    return apply_lut(image, luts)
 
 def contrast_stretch_channel(channel, min_out=0, max_out=255):
     """Tek bir kanal için kontrast germe işlemi."""
+    if channel.dtype == np.uint8:
+        # Tablo tabanlı yol: görüntü boyutunda ara float dizi oluşmaz
+        hist = np.bincount(channel.ravel(), minlength=256)
+        return apply_lut(channel, contrast_stretch_lut(hist, min_out, max_out))
+
     # Görüntünün min ve max değerlerini bul
     min_val = np.min(channel)
     max_val = np.max(channel)
@@ -72,9 +74,6 @@ def contrast_stretch_channel(channel, min_out=0, max_out=255):
     if min_val == max_val:
         return channel.copy()
     
-    # Yeni bir görüntü oluştur
-    stretched = np.zeros_like(channel, dtype=np.float32)
-    
     # Kontrast germe formülü: yeni_piksel = (piksel - min) * (max_out - min_out) / (max - min) + min_out
     stretched = (channel.astype(np.float32) - min_val) * (max_out - min_out) / (max_val - min_val) + min_out
     
@@ -86,6 +85,8 @@ def contrast_spreading(image, percentage=5):
     Kontrast yayma - histogramın en düşük ve en yüksek değerlerini kesip, 
     kalan değerleri tüm aralığa yayar.
     Elle yazılmış uygulama, hazır kütüphane fonksiyonu kullanılmamıştır.
+    Her kanalın tablosu np.bincount histogramından hesaplanır ve tüm kanallara
+    tek bir cv2.LUT çağrısıyla uygulanır.
     
     Parametreler:
     - image: Giriş görüntüsü
@@ -94,59 +95,67 @@ def contrast_spreading(image, percentage=5):
     Dönüş:
     - spread_image: Kontrast yayılmış görüntü
     """
-    # Çok kanallı görüntü için
-    if len(image.shape) == 3:
-        # BGR kanallarını ayır
-        b, g, r = cv2.split(image)
-        
-        # Her kanalı ayrı ayrı işle
-        b_spread = contrast_spread_channel(b, percentage)
-        g_spread = contrast_spread_channel(g, percentage)
-        r_spread = contrast_spread_channel(r, percentage)
-        
-        # Kanalları tekrar birleştir
-        return cv2.merge([b_spread, g_spread, r_spread])
-    else:
-        # Tek kanallı (gri tonlamalı) görüntü için
-        return contrast_spread_channel(image, percentage)
+    luts = np.stack([contrast_spread_lut(h, percentage) for h in channel_histograms(image)])
+    return apply_lut(image, luts)
 
 def contrast_spread_channel(channel, percentage=5):
     """Tek bir kanal için kontrast yayma işlemi."""
-    # Histogramı hesapla (elle)
-    hist = np.zeros(256, dtype=np.int32)
-    for val in channel.flatten():
-        hist[val] += 1
-    
-    # Kümülatif dağılımı hesapla
+    # Histogramı hesapla ve tabloyu uygula
+    hist = np.bincount(channel.ravel(), minlength=256)
+    return apply_lut(channel, contrast_spread_lut(hist, percentage))
+
+def channel_histograms(image):
+    """Her kanal için 256 kutulu histogram; (kanal sayısı, 256) int64 dizisi döndürür."""
+    channels = image.reshape(-1, image.shape[2]) if len(image.shape) == 3 else image.reshape(-1, 1)
+    return np.stack([np.bincount(channels[:, c], minlength=256) for c in range(channels.shape[1])])
+
+def apply_lut(image, lut):
+    """
+    uint8 görüntüye tablo uygular. lut (256,) ise tüm kanallara, (kanal sayısı, 256)
+    ise her kanala kendi tablosu tek bir cv2.LUT çağrısında uygulanır.
+    """
+    lut = np.asarray(lut, dtype=np.uint8)
+    if lut.ndim == 1 or (lut.shape[0] == 1 and len(image.shape) == 2):
+        return cv2.LUT(image, lut.reshape(256))
+    # Çok kanallı tablo: (256, 1, kanal) biçiminde
+    return cv2.LUT(image, np.ascontiguousarray(lut.T).reshape(256, 1, lut.shape[0]))
+
+def contrast_stretch_lut(hist, min_out=0, max_out=255):
+    """Tek kanal histogramından contrast_stretch_channel ile aynı sonucu veren tablo."""
+    values = np.flatnonzero(hist)
+    min_val, max_val = int(values[0]), int(values[-1])
+    if min_val == max_val:
+        return np.arange(256, dtype=np.uint8)
+    levels = np.arange(256, dtype=np.float32)
+    stretched = (levels - min_val) * (max_out - min_out) / (max_val - min_val) + min_out
+    return np.clip(stretched, min_out, max_out).astype(np.uint8)
+
+def contrast_spread_lut(hist, percentage=5):
+    """Tek kanal histogramından contrast_spread_channel ile aynı sonucu veren tablo."""
     cumsum = np.cumsum(hist)
-    
-    # Toplam piksel sayısı
-    total_pixels = channel.size
-    
-    # Alt ve üst eşik değerlerini belirle
+    total_pixels = cumsum[-1]
     min_thresh = total_pixels * (percentage / 100.0)
     max_thresh = total_pixels * (1 - percentage / 100.0)
-    
-    # Eşik değerlerine karşılık gelen piksel değerlerini bul
-    min_val = 0
-    max_val = 255
-    
-    for i in range(256):
-        if cumsum[i] >= min_thresh:
-            min_val = i
-            break
-    
-    for i in range(255, -1, -1):
-        if cumsum[i] <= max_thresh:
-            max_val = i
-            break
-    
-    # Yeni bir görüntü oluştur
-    spread = np.zeros_like(channel, dtype=np.float32)
-    
-    # Kontrast yayma formülü: yeni_piksel = (piksel - min_val) * 255 / (max_val - min_val)
-    if min_val < max_val:
-        spread = np.clip((channel.astype(np.float32) - min_val) * 255 / (max_val - min_val), 0, 255)
-    
-    # Değerleri uint8'e dönüştür
-    return spread.astype(np.uint8)
\ No newline at end of file
+    min_val = int(np.argmax(cumsum >= min_thresh))
+    below = np.flatnonzero(cumsum <= max_thresh)
+    max_val = int(below[-1]) if below.size else 255
+    if min_val >= max_val:
+        return np.zeros(256, dtype=np.uint8)
+    levels = np.arange(256, dtype=np.float32)
+    return np.clip((levels - min_val) * 255 / (max_val - min_val), 0, 255).astype(np.uint8)
+
+def equalize_lut(hist):
+    """Tek kanal histogramından cv2.equalizeHist ile aynı sonucu veren tablo."""
+    hist = np.asarray(hist, dtype=np.int64)
+    first = int(np.flatnonzero(hist)[0])
+    total = int(hist.sum())
+    lut = np.zeros(256, dtype=np.uint8)
+    if hist[first] == total:
+        lut[:] = first
+        return lut
+    # OpenCV ile aynı: float32 ölçek, en yakına yuvarlama
+    scale = np.float32(255) / np.float32(total - hist[first])
+    cumulative = (np.cumsum(hist) - hist[first]).astype(np.float32)
+    lut[first:] = np.clip(np.rint(cumulative[first:] * scale), 0, 255).astype(np.uint8)
+    return lut
+
@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# Bellekte tutulan en fazla kayıt (en eskiler atılır)
+MAX_EVENTS = 100000
+
+# Kayıt kapalıyken call() fonksiyonu doğrudan çağırır; ek maliyet tek bir bayrak kontrolüdür
+enabled = False
+_events = deque(maxlen=MAX_EVENTS)
+_lock = threading.Lock()
+
+def enable(flag=True):
+    """Süre/boyut kaydını açar veya kapatır."""
+    global enabled
+    enabled = bool(flag)
+
+def clear():
+    with _lock:
+        _events.clear()
+
+def events():
+    """Kayıtların kopyası (Chrome trace olay sözlükleri)."""
+    with _lock:
+        return list(_events)
+
+def drain():
+    """Kayıtları döndürür ve siler (ör. alt süreçlerden ana sürece aktarmak için)."""
+    with _lock:
+        drained = list(_events)
+        _events.clear()
+    return drained
+
+def extend(new_events):
+    with _lock:
+        _events.extend(new_events)
+
+def _describe(prefix, value):
+    if isinstance(value, np.ndarray):
+        return {f'{prefix}_shape': list(value.shape), f'{prefix}_dtype': str(value.dtype),
+                f'{prefix}_bytes': int(value.nbytes)}
+    return {}
+
+def add_span(name, start, wall, cpu=None, category='processing', **details):
+    """
+    Tamamlanmış bir süre kaydı ekler (Chrome trace 'X' olayı).
+    start: time.perf_counter() cinsinden başlangıç, wall/cpu: saniye.
+    """
+    details['wall_ms'] = wall * 1000
+    if cpu is not None:
+        details['cpu_ms'] = cpu * 1000
+    event = {
+        'name': name,
+        'cat': category,
+        'ph': 'X',
+        'ts': start * 1e6,
+        'dur': wall * 1e6,
+        'pid': os.getpid(),
+        'tid': threading.get_ident(),
+        'args': details,
+    }
+    with _lock:
+        _events.append(event)
+
+def call_named(name, func, image, *args, category='processing', **kwargs):
+    """
+    func(image, *args, **kwargs) çağırır. Kayıt açıksa duvar saati süresi, süreç CPU
+    süresi (tüm iş parçacıkları), giriş şekli/tipi ve çıkışın ayırdığı bellek kaydedilir.
+    """
+    if not enabled:
+        return func(image, *args, **kwargs)
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        result = func(image, *args, **kwargs)
+    except Exception as e:
+        add_span(name, start, time.perf_counter() - start, time.process_time() - cpu_start,
+                 category, error=f"{type(e).__name__}: {e}", **_describe('input', image))
+        raise
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    details = _describe('input', image)
+    details.update(_describe('output', result))
+    add_span(name, start, wall, cpu, category, **details)
+    return result
+
+def call(func, image, *args, **kwargs):
+    """call_named ile aynı; kayıt adı fonksiyonun adıdır."""
+    if not enabled:
+        return func(image, *args, **kwargs)
+    return call_named(getattr(func, '__name__', repr(func)), func, image, *args, **kwargs)
+
+def export_chrome_trace(path, trace_events=None):
+    """
+    Kayıtları Chrome trace biçiminde (chrome://tracing, Perfetto) JSON olarak yazar.
+    Yazılan olay sayısını döndürür.
+    """
+    if trace_events is None:
+        trace_events = events()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    return len(trace_events)
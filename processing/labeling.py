@@ -0,0 +1,63 @@
+import numpy as np
+import cv2
+from processing.binary import BinaryMask
+
+class Components:
+    """
+    Bağlı bileşen etiketleri ve nesne başına istatistikler.
+    labels: görüntüyle aynı boyutta int32 etiketler (0 arka plan, nesneler 1..count).
+    areas[i], centroids[i] (x, y) ve boxes[i] (x, y, genişlik, yükseklik) i + 1 etiketli nesneye aittir.
+    """
+
+    def __init__(self, labels, areas, centroids, boxes):
+        self.labels = labels
+        self.areas = areas
+        self.centroids = centroids
+        self.boxes = boxes
+
+    @property
+    def count(self):
+        return len(self.areas)
+
+    def centers(self):
+        """Ağırlık merkezleri tam sayı (x, y) piksel koordinatları olarak (N x 2)."""
+        return self.centroids.astype(np.int64)
+
+    def filter(self, min_area=0, max_area=None):
+        """Alanı [min_area, max_area] aralığında kalan nesneler; etiketler 1'den yeniden numaralanır."""
+        keep = self.areas >= min_area
+        if max_area is not None:
+            keep &= self.areas <= max_area
+        if keep.all():
+            return self
+        remap = np.zeros(self.count + 1, dtype=np.int32)
+        remap[1:][keep] = np.arange(1, int(keep.sum()) + 1, dtype=np.int32)
+        return Components(remap[self.labels], self.areas[keep], self.centroids[keep], self.boxes[keep])
+
+def _foreground(binary_image):
+    # Sıfırdan büyük pikseller 1 olan uint8 görünüm (bool dizi kopyalanmadan yeniden yorumlanır)
+    if isinstance(binary_image, BinaryMask):
+        return binary_image.to_bool().view(np.uint8)
+    if len(binary_image.shape) == 3:
+        binary_image = cv2.cvtColor(binary_image, cv2.COLOR_BGR2GRAY)
+    return (binary_image > 0).view(np.uint8)
+
+def connected_components(binary_image, connectivity=8, min_area=0):
+    """
+    İkili görüntüdeki beyaz nesneleri etiketler ve her nesnenin alanını, ağırlık
+    merkezini ve sınırlayıcı kutusunu döndürür (Components).
+    Etiketleme ve istatistikler OpenCV'nin birleşim-bul (union-find) tabanlı tek
+    taramasında birlikte hesaplanır; nesne sayısından bağımsız olarak görüntü
+    bir kez okunur.
+    """
+    count, labels, stats, centroids = cv2.connectedComponentsWithStats(
+        _foreground(binary_image), connectivity=connectivity, ltype=cv2.CV_32S
+    )
+    components = Components(
+        labels,
+        stats[1:, cv2.CC_STAT_AREA].astype(np.int64),
+        centroids[1:],
+        stats[1:, :cv2.CC_STAT_AREA].astype(np.int64),
+    )
+    return components.filter(min_area) if min_area > 0 else components
+
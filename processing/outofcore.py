@@ -0,0 +1,187 @@
+import inspect
+import mmap
+import os
+
+import cv2
+import numpy as np
+
+from processing.filters import edge_detection, sobel_magnitude
+from processing.tiling import OperationCancelled, operation_halo, row_bands
+from processing.threshold import otsu_threshold, kapur_threshold, manual_threshold, select_threshold
+
+# Bir karonun (halo dahil) girişte kaplayacağı en fazla bellek. Tepe bellek
+# kullanımı: karo, işlemin ara dizileri (karonun birkaç katı) ve yalnızca o anki
+# karonun eşlenmiş giriş/çıkış sayfaları (satır başına en fazla bir fazladan sayfa);
+# sayfalar her karodan sonra bırakıldığı için görüntü genişliğine bağlı değildir
+DEFAULT_TILE_BYTES = 16 * 1024 * 1024
+# Karo kenarının en az uzunluğu (küçük karolarda halo maliyeti baskın olur)
+_MIN_TILE_SIZE = 256
+
+# Görüntünün tamamının histogramına bağlı eşiklemeler: iki geçişte işlenir
+_GLOBAL_THRESHOLDS = {
+    otsu_threshold: 'otsu',
+    kapur_threshold: 'kapur',
+}
+
+def open_image_memmap(path, shape=None, dtype=np.uint8, offset=0):
+    """
+    Diskteki görüntüyü belleğe yüklemeden açar.
+    - .npy: np.load(mmap_mode='r')
+    - .tif/.tiff: tifffile.memmap (sıkıştırılmamış TIFF); karolu/sıkıştırılmış TIFF
+      için zarr kuruluysa karo karo okunan zarr dizisi döndürülür
+    - diğerleri ham (raw) veri kabul edilir; shape verilmelidir
+    Dönen nesne dilimlenebilir (source[y0:y1, x0:x1]) ve shape/dtype özelliklerine sahiptir.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.npy':
+        return np.load(path, mmap_mode='r')
+    if extension in ('.tif', '.tiff'):
+        try:
+            import tifffile
+        except ImportError:
+            raise ImportError("TIFF dosyalarını parça parça okumak için tifffile gerekli.")
+        try:
+            return tifffile.memmap(path, mode='r')
+        except ValueError:
+            # Veri dosyada bitişik değil (karolu ya da sıkıştırılmış)
+            try:
+                import zarr
+            except ImportError:
+                raise ImportError("Karolu/sıkıştırılmış TIFF için zarr gerekli.")
+            return zarr.open(tifffile.imread(path, aszarr=True), mode='r')
+    if shape is None:
+        raise ValueError("Ham görüntü dosyası için shape verilmelidir.")
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=tuple(shape))
+
+def create_output_memmap(path, shape, dtype=np.uint8):
+    """Sonuç için diskte .npy biçiminde yazılabilir bellek eşlemli dizi oluşturur."""
+    return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+
+def default_tile_size(shape, dtype, halo=0, tile_bytes=DEFAULT_TILE_BYTES):
+    """Halo dahil kare karonun bellek sınırına sığan kenar uzunluğu."""
+    channels = shape[2] if len(shape) == 3 else 1
+    side = int((tile_bytes / (np.dtype(dtype).itemsize * channels)) ** 0.5)
+    return max(_MIN_TILE_SIZE, side - 2 * halo)
+
+def image_tiles(shape, tile_size, halo):
+    """
+    Görüntüyü karolara böler: ((y0, y1, x0, x1), (giriş_y0, giriş_y1, giriş_x0, giriş_x1))
+    çiftleri üretir. Giriş aralığı karoyu her yönde halo kadar (sınıra kadar) genişletir.
+    """
+    height, width = shape[:2]
+    for y0, y1, in_y0, in_y1 in row_bands(height, tile_size, halo):
+        for x0, x1, in_x0, in_x1 in row_bands(width, tile_size, halo):
+            yield (y0, y1, x0, x1), (in_y0, in_y1, in_x0, in_x1)
+
+def _release_pages(array, y0, y1, x0, x1):
+    """
+    Bellek eşlemli dizinin [y0:y1, x0:x1] bölgesini kapsayan sayfaları bırakır
+    (veri dosyada / sayfa önbelleğinde kalır; yazılmış sayfalar kaybolmaz).
+    Aksi halde okunan/yazılan her sayfa eşleme kapanana kadar RSS'e eklenir.
+    Bölge, ilk satırının başından son satırının sonuna kadar tek bir bayt
+    aralığı olarak bırakılır; aradaki diğer sütunların sayfaları da düşer ve
+    gerekirse yeniden okunur.
+    """
+    if not isinstance(array, np.memmap):
+        return
+    mapping = getattr(array, '_mmap', None)
+    if mapping is None or not hasattr(mmap, 'MADV_DONTNEED') or y0 >= y1 or x0 >= x1:
+        return
+    base = np.frombuffer(mapping, dtype=np.uint8).ctypes.data
+    region = array[y0:y1, x0:x1]
+    first = region.ctypes.data - base
+    last = first + (y1 - y0 - 1) * region.strides[0] + (x1 - x0) * region.strides[1]
+    start = first - first % mmap.PAGESIZE
+    end = min(len(mapping), -(-last // mmap.PAGESIZE) * mmap.PAGESIZE)
+    mapping.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+def _stream_tiles(func, source, out, tile_size, halo, progress, should_cancel, args, kwargs):
+    tiles = list(image_tiles(source.shape, tile_size, halo))
+    for done, ((y0, y1, x0, x1), (in_y0, in_y1, in_x0, in_x1)) in enumerate(tiles, 1):
+        if should_cancel is not None and should_cancel():
+            raise OperationCancelled()
+        # Yalnızca bu karo (halo ile) belleğe okunur
+        tile = np.ascontiguousarray(source[in_y0:in_y1, in_x0:in_x1])
+        result = func(tile, *args, **kwargs)
+        result = result[y0 - in_y0:y1 - in_y0, x0 - in_x0:x1 - in_x0]
+        if not isinstance(out, np.ndarray) and callable(out):
+            out = out(result)
+        out[y0:y1, x0:x1] = result
+        # Karo yazılır yazılmaz okunan giriş ve yazılan çıkış sayfaları bırakılır
+        _release_pages(source, in_y0, in_y1, in_x0, in_x1)
+        _release_pages(out, y0, y1, x0, x1)
+        if progress is not None:
+            progress(done, len(tiles))
+    return out
+
+def stream_histogram(source, tile_size=None, gray=True):
+    """Kaynağın (gri tonlamalı) 256 kutulu histogramı, karo karo okunarak."""
+    if tile_size is None:
+        tile_size = default_tile_size(source.shape, source.dtype)
+    hist = np.zeros(256, dtype=np.int64)
+    for (y0, y1, x0, x1), _ in image_tiles(source.shape, tile_size, 0):
+        tile = np.ascontiguousarray(source[y0:y1, x0:x1])
+        if gray and tile.ndim == 3:
+            tile = cv2.cvtColor(tile, cv2.COLOR_BGR2GRAY)
+        hist += np.bincount(tile.ravel(), minlength=256)
+        _release_pages(source, y0, y1, x0, x1)
+    return hist
+
+def stream_edge_max(source, tile_size=None):
+    """Kaynağın Sobel gradyan büyüklüğünün en büyük değeri, karo karo (1 piksel halo ile) okunarak."""
+    if tile_size is None:
+        tile_size = default_tile_size(source.shape, source.dtype, 1)
+    peak = 0.0
+    for (y0, y1, x0, x1), (in_y0, in_y1, in_x0, in_x1) in image_tiles(source.shape, tile_size, 1):
+        magnitude = sobel_magnitude(np.ascontiguousarray(source[in_y0:in_y1, in_x0:in_x1]))
+        core = magnitude[y0 - in_y0:y1 - in_y0, x0 - in_x0:x1 - in_x0]
+        peak = max(peak, float(core.max()))
+        _release_pages(source, in_y0, in_y1, in_x0, in_x1)
+    return peak
+
+def _edge_normalization(source, args, kwargs):
+    bound = inspect.signature(edge_detection).bind(source, *args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments['normalization']
+
+def stream_apply(func, source, out, *args, tile_size=None, tile_bytes=DEFAULT_TILE_BYTES,
+                 progress=None, should_cancel=None, **kwargs):
+    """
+    Belleğe sığmayan görüntülerde func'ı halo ile genişletilmiş karolarda çalıştırır
+    ve sonucu bellek eşlemli çıkışa yazar. Bellek kullanımı görüntü boyutundan
+    bağımsızdır: karo ve ara dizileri ile o karonun eşlenmiş sayfalarıyla sınırlıdır
+    (bkz. DEFAULT_TILE_BYTES).
+
+    - func: processing.tiling'de halo'su tanımlı yerel işlemler (filtreler, morfoloji,
+      adaptif eşikleme), manual_threshold, görüntü geneli eşiklemeler
+      (otsu_threshold, kapur_threshold: önce histogram, sonra eşik uygulanır) veya
+      edge_detection ('global'/'two_pass' normalizasyonda önce en büyük gradyan
+      bulunur, sonra sabit ölçekle çıkış yazılır)
+    - source: open_image_memmap ile açılmış kaynak (ya da dilimlenebilir herhangi bir dizi)
+    - out: çıkış .npy dosyasının yolu ya da önceden oluşturulmuş yazılabilir dizi
+
+    Sonuç, işlemin bütün görüntüde çalıştırılmasıyla bire bir aynıdır.
+    Çıkış dizisini (np.memmap) döndürür.
+    """
+    if func in _GLOBAL_THRESHOLDS:
+        threshold = select_threshold(stream_histogram(source, tile_size), _GLOBAL_THRESHOLDS[func])
+        func, args, kwargs = manual_threshold, (threshold,), {}
+    elif func is edge_detection and _edge_normalization(source, args, kwargs) in ('global', 'two_pass'):
+        peak = stream_edge_max(source, tile_size)
+        args, kwargs = (), {'normalization': 'fixed', 'max_magnitude': peak}
+    if func is manual_threshold:
+        halo = 0
+    else:
+        halo = operation_halo(func, source, *args, **kwargs)
+    if tile_size is None:
+        tile_size = default_tile_size(source.shape, source.dtype, halo, tile_bytes)
+
+    if isinstance(out, (str, os.PathLike)):
+        path = out
+        height, width = source.shape[:2]
+        # Çıkış şekli/tipi ilk karonun sonucundan belirlenir
+        out = lambda first: create_output_memmap(path, (height, width) + first.shape[2:], first.dtype)
+    out = _stream_tiles(func, source, out, tile_size, halo, progress, should_cancel, args, kwargs)
+    if hasattr(out, 'flush'):
+        out.flush()
+    return out
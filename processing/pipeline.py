@@ -0,0 +1,108 @@
+import numpy as np
+
+from processing.histogram import (
+    histogram_equalization, contrast_stretching, contrast_spreading,
+    channel_histograms, apply_lut, contrast_stretch_lut, contrast_spread_lut, equalize_lut
+)
+from processing.threshold import manual_threshold, threshold_lut
+from processing import instrumentation
+
+def _per_channel(lut_builder):
+    # Her kanala kendi histogramından tablo üreten noktasal işlem
+    def build(hists, *args, **kwargs):
+        return np.stack([lut_builder(h, *args, **kwargs) for h in hists])
+    return build
+
+def _gray_only(lut_builder):
+    # Yalnızca tek kanallı girişte noktasal olan işlem (renkli girişte gri dönüşüm gerekir)
+    def build(hists, *args, **kwargs):
+        if len(hists) != 1:
+            return None
+        return lut_builder(hists[0], *args, **kwargs)[np.newaxis]
+    return build
+
+# Noktasal işlemler: giriş histogramından (kanal sayısı, 256) tablo üreten fonksiyonlar.
+# None dönerse işlem bu giriş için birleştirilemez ve normal şekilde çalıştırılır.
+POINT_OPERATIONS = {
+    contrast_stretching: _per_channel(contrast_stretch_lut),
+    contrast_spreading: _per_channel(contrast_spread_lut),
+    histogram_equalization: _gray_only(equalize_lut),
+    manual_threshold: _gray_only(lambda hist, threshold=127: threshold_lut(threshold)),
+}
+
+def _push_histograms(hists, luts):
+    # Tablo uygulandıktan sonraki histogram: görüntüyü oluşturmadan hesaplanır
+    return np.stack([
+        np.bincount(lut, weights=hist, minlength=256).astype(np.int64)
+        for hist, lut in zip(hists, luts)
+    ])
+
+class Pipeline:
+    """
+    processing/* fonksiyonlarını sırayla uygulayan yeniden kullanılabilir işlem zinciri.
+    Art arda gelen noktasal uint8 işlemler (kontrast germe/yayma, histogram eşitleme,
+    manuel eşikleme) tek bir tabloda birleştirilir: veriye bağlı tablolar, bir önceki
+    tablonun histogram üzerinden ilerletilmesiyle hesaplanır ve görüntü tek geçişte
+    işlenir. Sonuç adımların tek tek çalıştırılmasıyla bire bir aynıdır.
+
+    Örnek:
+        pipeline = Pipeline().then(histogram_equalization).then(contrast_stretching) \\
+                             .then(manual_threshold, 127)
+        binary = pipeline(image)
+    """
+
+    def __init__(self, steps=None):
+        self.steps = [(func, tuple(args), dict(kwargs)) for func, args, kwargs in (steps or [])]
+
+    def then(self, func, *args, **kwargs):
+        """Zincirin sonuna bir adım ekler; zincirleme çağrı için kendini döndürür."""
+        self.steps.append((func, args, kwargs))
+        return self
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __call__(self, image):
+        return self.run(image)
+
+    def run(self, image):
+        i = 0
+        while i < len(self.steps):
+            fused = self._fuse_from(i, image)
+            if fused is not None:
+                luts, end = fused
+                name = '+'.join(func.__name__ for func, _, _ in self.steps[i:end])
+                image = instrumentation.call_named(name, apply_lut, image, luts)
+                i = end
+            else:
+                func, args, kwargs = self.steps[i]
+                image = instrumentation.call(func, image, *args, **kwargs)
+                i += 1
+        return image
+
+    def _fuse_from(self, start, image):
+        """
+        start'tan itibaren birleştirilebilen noktasal adımları tek tabloda toplar.
+        (birleşik tablo, sonraki adım) döndürür; hiçbir adım birleştirilemezse None.
+        """
+        if image.dtype != np.uint8:
+            return None
+        hists = None
+        luts = None
+        i = start
+        while i < len(self.steps):
+            func, args, kwargs = self.steps[i]
+            builder = POINT_OPERATIONS.get(func)
+            if builder is None:
+                break
+            if hists is None:
+                hists = channel_histograms(image)
+            stage = builder(hists, *args, **kwargs)
+            if stage is None:
+                break
+            luts = stage if luts is None else np.take_along_axis(stage, luts, axis=1)
+            hists = _push_histograms(hists, stage)
+            i += 1
+        if luts is None:
+            return None
+        return luts, i
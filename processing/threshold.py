@@ -1,14 +1,23 @@
 import numpy as np
 import cv2
 
+from processing.filters import box_sum
+
 def manual_threshold(image, threshold=127):
     # Ensure grayscale
     if len(image.shape) == 3:
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    if image.dtype == np.uint8:
+        # 256 elemanlı tablo ile tek geçiş
+        return cv2.LUT(image, threshold_lut(threshold))
     binary = np.zeros_like(image)
     binary[image > threshold] = 255
     return binary
 
+def threshold_lut(threshold=127):
+    """manual_threshold ile aynı sonucu veren 256 elemanlı tablo."""
+    return np.where(np.arange(256) > threshold, 255, 0).astype(np.uint8)
+
 def otsu_threshold(image):
     # Ensure grayscale
     if len(image.shape) == 3:
@@ -20,35 +29,166 @@ def kapur_threshold(image):
     # Ensure grayscale
     if len(image.shape) == 3:
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    hist = cv2.calcHist([image], [0], None, [256], [0, 256]).ravel()
-    hist = hist / hist.sum()
-    cumsum = np.cumsum(hist)
-    entropy_b = np.zeros(256)
-    entropy_f = np.zeros(256)
-    for t in range(256):
-        # Background
-        if cumsum[t] > 0:
-            p_b = hist[:t+1] / cumsum[t]
-            entropy_b[t] = -np.sum(p_b[p_b > 0] * np.log(p_b[p_b > 0]))
-        # Foreground
-        if cumsum[t] < 1:
-            p_f = hist[t+1:] / (1 - cumsum[t])
-            entropy_f[t] = -np.sum(p_f[p_f > 0] * np.log(p_f[p_f > 0]))
-    kapur = entropy_b + entropy_f
-    thresh = np.argmax(kapur)
-    _, binary = cv2.threshold(image, thresh, 255, cv2.THRESH_BINARY)
-    return binary
+    hist = np.bincount(image.ravel(), minlength=256)
+    thresh = select_threshold(hist, method='kapur')
+    return cv2.LUT(image, threshold_lut(thresh))
+
+# select_threshold ile seçilebilen yöntemler
+THRESHOLD_METHODS = ('otsu', 'kapur')
+# Çok seviyeli aramada aynı anda işlenen histogram sayısı (bellek sınırı)
+_MULTILEVEL_CHUNK = 64
+
+def _normalized_histograms(hist):
+    # (..., 256) histogramları (N, 256) olasılık ve kümülatif sayı dizilerine çevir
+    hist = np.asarray(hist, dtype=np.float64)
+    if hist.shape[-1] != 256:
+        raise ValueError("Histogramın son ekseni 256 elemanlı olmalı")
+    batch_shape = hist.shape[:-1]
+    hist = hist.reshape(-1, 256)
+    counts = np.cumsum(hist, axis=1)
+    total = counts[:, -1:]
+    p = np.divide(hist, total, out=np.zeros_like(hist), where=total > 0)
+    return p, counts, total, batch_shape
 
-def local_threshold(image, block_size=16, c=5):
+def _otsu_two_level(p):
+    # cv2.threshold(THRESH_OTSU) ile aynı ölçüt ve aynı eşitlik kuralı (ilk maksimum)
+    omega = np.cumsum(p, axis=1)
+    mu = np.cumsum(p * np.arange(256), axis=1)
+    mu_total = mu[:, -1:]
+    q2 = 1.0 - omega
+    eps = np.finfo(np.float32).eps
+    valid = (np.minimum(omega, q2) >= eps) & (np.maximum(omega, q2) <= 1.0 - eps)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu1 = mu / omega
+        mu2 = (mu_total - mu) / q2
+        sigma = omega * q2 * (mu1 - mu2) ** 2
+    sigma = np.where(valid, sigma, -1.0)
+    thresh = np.argmax(sigma, axis=1)
+    # Hiç geçerli eşik yoksa (tek renkli görüntü) cv2 gibi 0 döndür
+    thresh[~valid.any(axis=1)] = 0
+    return thresh
+
+def _kapur_two_level(p, counts, total):
+    # H_b(t) = log P(t) - S(t) / P(t),  S(t) = sum_{i<=t} p_i log p_i
+    # H_f(t) = log(1 - P(t)) - (S_toplam - S(t)) / (1 - P(t))
+    # Ağırlıklar sayılardan hesaplanır: tüm pikseller tek sınıftaysa ağırlık tam
+    # olarak 1 olur ve eşit ölçütlü eşiklerden ilki seçilir
+    plogp = p * np.log(np.where(p > 0, p, 1.0))
+    s = np.cumsum(plogp, axis=1)
+    background = counts > 0
+    foreground = counts < total
+    safe_total = np.where(total > 0, total, 1.0)
+    omega = counts / safe_total
+    q2 = (total - counts) / safe_total
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropy_b = np.where(background, np.log(omega) - s / omega, 0.0)
+        entropy_f = np.where(foreground, np.log(q2) - (s[:, -1:] - s) / q2, 0.0)
+    return np.argmax(entropy_b + entropy_f, axis=1)
+
+def _segment_scores(p, counts, method):
+    # scores[n, a, b]: [a, b) aralığındaki histogram dilimi tek sınıf olduğunda
+    # yöntemin ölçütüne katkısı (a < b olmayan yerler -inf)
+    zero = np.zeros((p.shape[0], 1))
+    weight = np.concatenate([zero, np.cumsum(p, axis=1)], axis=1)
+    count = np.concatenate([zero, counts], axis=1)
+    if method == 'otsu':
+        # Sınıflar arası varyansı büyütmek sum(w_k * mu_k^2)'yi büyütmekle aynıdır
+        moment = np.concatenate([zero, np.cumsum(p * np.arange(256), axis=1)], axis=1)
+    else:
+        moment = np.concatenate([zero, np.cumsum(p * np.log(np.where(p > 0, p, 1.0)), axis=1)], axis=1)
+    w = weight[:, None, :] - weight[:, :, None]
+    m = moment[:, None, :] - moment[:, :, None]
+    nonempty = (count[:, None, :] - count[:, :, None]) > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'otsu':
+            scores = np.where(nonempty, m * m / w, 0.0)
+        else:
+            scores = np.where(nonempty, np.log(w) - m / w, 0.0)
+    upper = np.triu(np.ones((257, 257), dtype=bool), k=1)
+    return np.where(upper, scores, -np.inf)
+
+def _multilevel(p, counts, method, classes):
+    # Histogramı ardışık 'classes' dilime bölen en iyi ayrım, dinamik programlama ile:
+    # best[j][b] = max_a best[j-1][a] + scores[a, b]
+    n = p.shape[0]
+    thresholds = np.empty((n, classes - 1), dtype=np.intp)
+    rows = np.arange(n)
+    for start in range(0, n, _MULTILEVEL_CHUNK):
+        stop = min(start + _MULTILEVEL_CHUNK, n)
+        chunk_rows = rows[:stop - start]
+        scores = _segment_scores(p[start:stop], counts[start:stop], method)
+        best = scores[:, 0, :]
+        choices = []
+        for _ in range(classes - 1):
+            candidates = best[:, :, None] + scores
+            choices.append(np.argmax(candidates, axis=1))
+            best = np.max(candidates, axis=1)
+        # Geriye doğru izleyerek dilim sınırlarını bul
+        end = np.full(stop - start, 256)
+        for level in range(classes - 2, -1, -1):
+            end = choices[level][chunk_rows, end]
+            thresholds[start:stop, level] = end - 1
+    return thresholds
+
+def select_threshold(hist, method='otsu', classes=2):
+    """
+    Histogramdan eşik değer(ler)ini seçer; görüntü oluşturmaz.
+    
+    Parametreler:
+    - hist: 256 elemanlı histogram ya da (..., 256) histogram yığını
+    - method: 'otsu' veya 'kapur'
+    - classes: Sınıf sayısı; 2'den büyükse çok seviyeli eşikleme yapılır
+    
+    Dönüş:
+    - classes == 2: eşik değeri (tek histogram için int, yığın için (...,) dizi)
+    - classes > 2: artan sırada classes - 1 eşik ((..., classes - 1) dizi)
+    Eşik t, t'den büyük piksellerin üst sınıfa ait olduğu anlamına gelir.
+    """
+    if method not in THRESHOLD_METHODS:
+        raise ValueError("Bilinmeyen eşikleme yöntemi: %r" % (method,))
+    if not 2 <= classes <= 256:
+        raise ValueError("Sınıf sayısı 2 ile 256 arasında olmalı")
+    p, counts, total, batch_shape = _normalized_histograms(hist)
+    if classes == 2:
+        if method == 'otsu':
+            thresholds = _otsu_two_level(p)
+        else:
+            thresholds = _kapur_two_level(p, counts, total)
+        if not batch_shape:
+            return int(thresholds[0])
+        return thresholds.reshape(batch_shape)
+    thresholds = _multilevel(p, counts, method, classes)
+    return thresholds.reshape(batch_shape + (classes - 1,))
+
+def _block_edges(length, block_size):
+    # Blok başlangıçları ve blok uzunlukları (son blok kısa olabilir)
+    starts = np.arange(0, length, block_size)
+    return starts, np.minimum(block_size, length - starts)
+
+def _interpolation_weights(length, starts, sizes):
+    """
+    Her piksel için komşu iki blok merkezinin indeksleri ve ağırlığı (CLAHE'deki gibi).
+    Kenardaki yarım bloklarda en yakın blok merkezinin değeri kullanılır.
+    """
+    centers = starts + (sizes - 1) / 2.0
+    position = np.interp(np.arange(length), centers, np.arange(len(centers)))
+    low = np.floor(position).astype(np.intp)
+    high = np.minimum(low + 1, len(centers) - 1)
+    return low, high, (position - low).astype(np.float32)
+
+def local_threshold(image, block_size=16, c=5, interpolate=False):
     """
     Elle yazılmış yerel eşikleme (local thresholding) algoritması.
     Bu fonksiyon görüntüyü küçük bloklara böler ve her bir blok için ayrı
     eşik değerleri hesaplayarak adaptif eşikleme yapar (shading correction).
+    Tüm blok ortalamaları tek bir indirgeme (np.add.reduceat) ile hesaplanır.
     
     Parametreler:
     - image: Eşiklenecek görüntü
     - block_size: Yerel bölge boyutu (varsayılan: 16x16 piksel)
     - c: Eşik değerinden çıkarılacak sabit (düşük değerler daha fazla beyaz piksel)
+    - interpolate: True ise blok eşikleri blok merkezleri arasında çift doğrusal
+      (bilinear) olarak ara değerlenir; blok sınırlarındaki keskin geçişler kaybolur
     
     Dönüş:
     - binary: İkili (binary) görüntü 
@@ -57,72 +197,104 @@ def local_threshold(image, block_size=16, c=5):
     if len(image.shape) == 3:
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     
-    # Görüntü boyutları
+    # Görüntü boyutları ve blok sınırları
     height, width = image.shape
+    row_starts, row_sizes = _block_edges(height, block_size)
+    col_starts, col_sizes = _block_edges(width, block_size)
     
-    # Çıkış görüntüsü
-    binary = np.zeros_like(image)
+    # Blok toplamları -> blok eşikleri (ortalama - c)
+    accumulator = np.int64 if np.issubdtype(image.dtype, np.integer) else np.float64
+    sums = np.add.reduceat(np.add.reduceat(image, row_starts, axis=0, dtype=accumulator),
+                           col_starts, axis=1)
+    thresholds = sums / np.outer(row_sizes, col_sizes) - c
     
-    # Görüntüyü bloklara böl
-    for y in range(0, height, block_size):
-        for x in range(0, width, block_size):
-            # Blok sınırlarını belirle
-            block_end_y = min(y + block_size, height)
-            block_end_x = min(x + block_size, width)
-            
-            # Bloğu al
-            block = image[y:block_end_y, x:block_end_x]
-            
-            # Blok için eşik değeri hesapla (ortalama - c)
-            threshold = np.mean(block) - c
-            
-            # Eşikleme uygula
-            mask = block > threshold
-            binary[y:block_end_y, x:block_end_x][mask] = 255
+    if interpolate:
+        rows = _interpolation_weights(height, row_starts, row_sizes)
+        cols = _interpolation_weights(width, col_starts, col_sizes)
+        # Önce her blok satırında sütunlar, sonra satırlar boyunca ara değerle
+        thresholds = thresholds.astype(np.float32)
+        across = thresholds[:, cols[0]] * (1 - cols[2]) + thresholds[:, cols[1]] * cols[2]
+        weight = rows[2][:, np.newaxis]
+        pixel_thresholds = across[rows[0]] * (1 - weight) + across[rows[1]] * weight
+        mask = image > pixel_thresholds
+    elif np.issubdtype(image.dtype, np.integer):
+        # Tam sayı piksel için  p > t  ⇔  p >= floor(t) + 1 : eşikler küçük tam sayı tipinde genişletilir
+        cutoffs = np.clip(np.floor(thresholds) + 1, -1, 256).astype(np.int16)
+        mask = image >= np.repeat(np.repeat(cutoffs, row_sizes, axis=0), col_sizes, axis=1)
+    else:
+        mask = image > np.repeat(np.repeat(thresholds, row_sizes, axis=0), col_sizes, axis=1)
     
+    # Çıkış görüntüsü
+    binary = np.zeros_like(image)
+    binary[mask] = 255
     return binary
 
-def adaptive_local_threshold(image, window_size=51, c=10):
+# adaptive_local_threshold yöntemleri ve varsayılan k katsayıları
+ADAPTIVE_METHODS = ('mean', 'niblack', 'sauvola')
+_DEFAULT_K = {'niblack': -0.2, 'sauvola': 0.2}
+
+def local_statistics(image, window_size, with_std=True):
+    """
+    Her piksel için window_size x window_size penceredeki ortalama ve standart sapma.
+    Görüntünün ve karesinin özet alan tabloları (kenarlar aynalanarak) kullanılır;
+    maliyet pencere boyutundan bağımsızdır. (ortalama, std) döndürür (with_std=False ise std None).
+    """
+    area = window_size * window_size
+    mean = box_sum(image, window_size, mode='reflect') / area
+    if not with_std:
+        return mean, None
+    squares = image.astype(np.int64) ** 2 if np.issubdtype(image.dtype, np.integer) \
+        else image.astype(np.float64) ** 2
+    variance = box_sum(squares, window_size, mode='reflect') / area - mean * mean
+    return mean, np.sqrt(np.maximum(variance, 0))
+
+def adaptive_local_threshold(image, window_size=51, c=10, method='mean', k=None, r=128):
     """
     Gelişmiş adaptif yerel eşikleme.
-    Her piksel için etrafındaki bir pencere alınır ve piksel değeri
-    yerel pencere ortalamasının altındaysa 0, üstündeyse 255 olarak ayarlanır.
+    Her piksel için etrafındaki pencerenin istatistiklerinden bir eşik hesaplanır;
+    piksel eşikten büyükse 255, değilse 0 olur. Pencere ortalaması ve varyansı
+    özet alan tablolarından piksel başına sabit maliyetle elde edilir.
     
     Parametreler:
     - image: Eşiklenecek görüntü
     - window_size: Yerel pencere boyutu (tek sayı olmalı)
-    - c: Ortalamadan çıkarılacak sabit
+    - c: Eşikten çıkarılacak sabit
+    - method: 'mean'    -> eşik = m - c
+              'niblack' -> eşik = m + k * s - c          (varsayılan k = -0.2)
+              'sauvola' -> eşik = m * (1 + k * (s / r - 1)) - c  (varsayılan k = 0.2)
+      (m: yerel ortalama, s: yerel standart sapma)
+    - k: Niblack/Sauvola katsayısı
+    - r: Sauvola için standart sapmanın dinamik aralığı
     
     Dönüş:
     - binary: İkili (binary) görüntü
     """
+    if method not in ADAPTIVE_METHODS:
+        raise ValueError("Bilinmeyen adaptif eşikleme yöntemi: %r" % (method,))
     # Gri tonlamalı görüntüye çevir
     if len(image.shape) == 3:
         image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     
-    # Görüntü boyutları
-    height, width = image.shape
+    mean, std = local_statistics(image, window_size, with_std=method != 'mean')
+    if k is None:
+        k = _DEFAULT_K.get(method, 0.0)
+    if method == 'mean':
+        threshold = mean
+    elif method == 'niblack':
+        threshold = mean + k * std
+    else:
+        threshold = mean * (1 + k * (std / r - 1))
+    threshold -= c
     
     # Çıkış görüntüsü
     binary = np.zeros_like(image)
-    
-    # Kenar padding miktarı
-    pad = window_size // 2
-    
-    # Kenarları aynalayarak görüntüyü genişlet
-    padded = np.pad(image, pad, mode='reflect')
-    
-    # Her piksel için
-    for i in range(height):
-        for j in range(width):
-            # Yerel pencereyi al
-            window = padded[i:i+window_size, j:j+window_size]
-            
-            # Yerel ortalama hesapla
-            local_mean = np.mean(window)
-            
-            # Eşikleme uygula
-            if image[i, j] > local_mean - c:
-                binary[i, j] = 255
-    
-    return binary 
\ No newline at end of file
+    binary[image > threshold] = 255
+    return binary
+
+def niblack_threshold(image, window_size=25, k=-0.2, c=0):
+    """Niblack yerel eşikleme: eşik = m + k * s - c."""
+    return adaptive_local_threshold(image, window_size, c, method='niblack', k=k)
+
+def sauvola_threshold(image, window_size=25, k=0.2, r=128, c=0):
+    """Sauvola yerel eşikleme (belgeler için): eşik = m * (1 + k * (s / r - 1)) - c."""
+    return adaptive_local_threshold(image, window_size, c, method='sauvola', k=k, r=r)
@@ -0,0 +1,133 @@
+import os
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from processing.filters import (
+    mean_filter, median_filter, sharpening_filter, smoothing_filter, box_filter, edge_detection
+)
+from processing.morphology import dilation, erosion, rect_max, rect_min
+from processing.threshold import adaptive_local_threshold, niblack_threshold, sauvola_threshold
+
+class OperationCancelled(Exception):
+    """Bantlı çalıştırma tamamlanmadan iptal edildiğinde fırlatılır."""
+
+# Bantların en az yüksekliği (çok ince bantlarda halo maliyeti baskın olur)
+_MIN_BAND_ROWS = 64
+
+def _kernel_halo(size):
+    # Kare kernel için k // 2, dikdörtgen yapı elemanı için uzun kenar // 2
+    # (aynı halo hem satır bantlarında hem iki boyutlu karolarda geçerli olur)
+    if np.isscalar(size):
+        return int(size) // 2
+    return max(int(s) for s in size) // 2
+
+def _edge_halo(p):
+    # Görüntü geneli normalizasyon bantlara bölünemez; sabit ölçek ve karo başına
+    # normalizasyon yereldir ('tile' kipinde her bant kendi en büyüğüyle ölçeklenir)
+    return 1 if p['normalization'] in ('fixed', 'tile') else None
+
+# İşlem -> halo hesabı (komşuluk yarıçapı). Burada olmayan (ya da halo'su None olan)
+# işlemler bantlara bölündüğünde aynı sonucu vermez.
+_HALO = {
+    edge_detection: _edge_halo,
+    mean_filter: lambda p: _kernel_halo(p['kernel_size']),
+    box_filter: lambda p: _kernel_halo(p['kernel_size']),
+    median_filter: lambda p: _kernel_halo(p['kernel_size']),
+    smoothing_filter: lambda p: _kernel_halo(p['kernel_size']),
+    sharpening_filter: lambda p: 1,
+    dilation: lambda p: _kernel_halo(p['kernel_size']),
+    erosion: lambda p: _kernel_halo(p['kernel_size']),
+    rect_max: lambda p: _kernel_halo(p['kernel_size']),
+    rect_min: lambda p: _kernel_halo(p['kernel_size']),
+    adaptive_local_threshold: lambda p: int(p['window_size']) // 2,
+    niblack_threshold: lambda p: int(p['window_size']) // 2,
+    sauvola_threshold: lambda p: int(p['window_size']) // 2,
+}
+
+def _bound_halo(func, image, args, kwargs):
+    if func not in _HALO:
+        return None
+    bound = inspect.signature(func).bind(image, *args, **kwargs)
+    bound.apply_defaults()
+    return _HALO[func](bound.arguments)
+
+def operation_halo(func, image, *args, **kwargs):
+    """
+    Verilen parametrelerle çağrılan işlemin ihtiyaç duyduğu halo (satır sayısı).
+    Bantlara bölünemeyen işlemler için ValueError fırlatır.
+    """
+    halo = _bound_halo(func, image, args, kwargs)
+    if halo is None:
+        raise ValueError(f"{func.__name__} bu parametrelerle bantlara bölünerek çalıştırılamaz.")
+    return halo
+
+def row_bands(height, band_rows, halo):
+    """
+    (başlangıç, bitiş, giriş_başlangıcı, giriş_bitişi) dörtlüleri üretir.
+    Giriş aralığı bandı her iki yönde halo kadar (görüntü sınırına kadar) genişletir.
+    """
+    for start in range(0, height, band_rows):
+        end = min(start + band_rows, height)
+        yield start, end, max(0, start - halo), min(height, end + halo)
+
+def apply_tiled(func, image, *args, halo=0, band_rows=None, workers=None,
+                progress=None, should_cancel=None, **kwargs):
+    """
+    func'ı görüntünün halo ile genişletilmiş satır bantlarında bir iş parçacığı
+    havuzunda çalıştırır ve sonuçları önceden ayrılmış çıkışa birleştirir.
+    Bant sınırlarında halo gerçek komşu pikselleri sağladığı, görüntü kenarındaki
+    bantlar ise işlemin kendi kenar dolgusunu kullandığı için sonuç tek iş
+    parçacıklı çalıştırmayla bire bir aynıdır. NumPy/OpenCV çekirdekleri GIL'i
+    bıraktığı için bantlar gerçekten paralel çalışır.
+
+    progress(tamamlanan, toplam) her bant bittiğinde çağrılır; should_cancel()
+    True döndürürse kalan bantlar iptal edilir ve OperationCancelled fırlatılır.
+    """
+    height = image.shape[0]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if band_rows is None:
+        band_rows = max(_MIN_BAND_ROWS, -(-height // (workers * 4)))
+    bands = list(row_bands(height, band_rows, halo))
+    if len(bands) == 1:
+        result = func(image, *args, **kwargs)
+        if progress is not None:
+            progress(1, 1)
+        return result
+
+    def run(band):
+        start, end, in_start, in_end = band
+        if should_cancel is not None and should_cancel():
+            return None
+        result = func(image[in_start:in_end], *args, **kwargs)
+        return result[start - in_start:end - in_start]
+
+    out = None
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(run, band) for band in bands]
+        for done, ((start, end, _, _), future) in enumerate(zip(bands, futures), 1):
+            result = future.result()
+            if should_cancel is not None and should_cancel():
+                for pending in futures:
+                    pending.cancel()
+                raise OperationCancelled()
+            if out is None:
+                out = np.empty((height,) + result.shape[1:], dtype=result.dtype)
+            out[start:end] = result
+            if progress is not None:
+                progress(done, len(bands))
+    return out
+
+def supports_tiling(func, *args, **kwargs):
+    """İşlem (verilen parametrelerle) halo ile bantlara bölünerek çalıştırılabilir mi?"""
+    return _bound_halo(func, None, args, kwargs) is not None
+
+def parallel_apply(func, image, *args, band_rows=None, workers=None,
+                   progress=None, should_cancel=None, **kwargs):
+    """İşlemin halo değerini parametrelerinden hesaplayıp apply_tiled ile çalıştırır."""
+    halo = operation_halo(func, image, *args, **kwargs)
+    return apply_tiled(func, image, *args, halo=halo, band_rows=band_rows,
+                       workers=workers, progress=progress,
+                       should_cancel=should_cancel, **kwargs)
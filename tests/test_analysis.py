@@ -0,0 +1,61 @@
+import cv2
+import numpy as np
+import pytest
+
+from processing.analysis import zhang_suen_thinning
+
+def _reference_thinning(binary_image):
+    # Zhang & Suen (1984) iki alt adımlı döngü; alt adım içinde işaretlenenler birlikte silinir
+    image = (binary_image > 127).astype(np.uint8)
+    h, w = image.shape
+    while True:
+        previous = image.copy()
+        for step in (0, 1):
+            marker = np.zeros_like(image)
+            for i in range(1, h - 1):
+                for j in range(1, w - 1):
+                    if not image[i, j]:
+                        continue
+                    p2, p3, p4 = image[i - 1, j], image[i - 1, j + 1], image[i, j + 1]
+                    p5, p6, p7 = image[i + 1, j + 1], image[i + 1, j], image[i + 1, j - 1]
+                    p8, p9 = image[i, j - 1], image[i - 1, j - 1]
+                    ring = [p2, p3, p4, p5, p6, p7, p8, p9, p2]
+                    transitions = sum(1 for k in range(8) if ring[k] == 0 and ring[k + 1] == 1)
+                    neighbours = int(sum(ring[:8]))
+                    if step == 0:
+                        first, second = p2 * p4 * p6, p4 * p6 * p8
+                    else:
+                        first, second = p2 * p4 * p8, p2 * p6 * p8
+                    if transitions == 1 and 2 <= neighbours <= 6 and first == 0 and second == 0:
+                        marker[i, j] = 1
+            image &= 1 - marker
+        if np.array_equal(image, previous):
+            return image * 255
+
+def _shapes(seed):
+    rng = np.random.default_rng(seed)
+    h, w = (int(v) for v in rng.integers(5, 40, 2))
+    image = np.zeros((h, w), dtype=np.uint8)
+    for _ in range(int(rng.integers(1, 6))):
+        center = (int(rng.integers(0, w)), int(rng.integers(0, h)))
+        cv2.circle(image, center, int(rng.integers(1, 12)), 255, -1)
+    cv2.rectangle(image, (1, h // 2), (w - 2, h // 2 + 2), 255, -1)
+    return image
+
+@pytest.mark.parametrize('seed', range(12))
+def test_thinning_matches_reference_on_shapes(seed):
+    image = _shapes(seed)
+    assert np.array_equal(zhang_suen_thinning(image), _reference_thinning(image))
+
+@pytest.mark.parametrize('seed', range(6))
+def test_thinning_matches_reference_on_random_masks(seed):
+    rng = np.random.default_rng(100 + seed)
+    image = np.where(rng.random((23, 31)) < 0.4 + 0.05 * seed, 255, 0).astype(np.uint8)
+    assert np.array_equal(zhang_suen_thinning(image), _reference_thinning(image))
+
+def test_thinning_handles_full_and_color_images():
+    full = np.full((12, 15), 255, dtype=np.uint8)
+    assert np.array_equal(zhang_suen_thinning(full), _reference_thinning(full))
+    shapes = _shapes(3)
+    color = cv2.cvtColor(shapes, cv2.COLOR_GRAY2BGR)
+    assert np.array_equal(zhang_suen_thinning(color), _reference_thinning(shapes))
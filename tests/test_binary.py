@@ -0,0 +1,28 @@
+import cv2
+import numpy as np
+import pytest
+
+from processing.binary import BinaryMask
+from processing.morphology import rect_max, rect_min
+
+def _random_mask(shape, density, seed=0):
+    return np.random.default_rng(seed).random(shape) < density
+
+# Genişlikler 64 bitlik kelime sınırlarını ve kısmi son kelimeyi kapsar
+@pytest.mark.parametrize('shape', [(9, 5), (40, 64), (33, 130)])
+@pytest.mark.parametrize('kernel_size', [2, 3, 4, 7, (3, 5), (6, 1)])
+def test_dilate_and_erode_match_uint8_morphology(shape, kernel_size):
+    image = _random_mask(shape, 0.2, seed=shape[1]).astype(np.uint8) * 255
+    mask = BinaryMask.from_image(image)
+    assert np.array_equal(mask.dilate(kernel_size).to_image(), rect_max(image, kernel_size, border_value=0))
+    dense = 255 - image
+    assert np.array_equal(BinaryMask.from_image(dense).erode(kernel_size).to_image(),
+                          rect_min(dense, kernel_size, border_value=255))
+
+@pytest.mark.parametrize('shape', [(1, 1), (17, 63), (50, 200)])
+@pytest.mark.parametrize('density', [0.0, 0.3, 1.0])
+def test_moments_match_opencv(shape, density):
+    image = _random_mask(shape, density).astype(np.uint8) * 255
+    expected = cv2.moments(image, binaryImage=True)
+    m00, m10, m01 = BinaryMask.from_image(image).moments()
+    assert (m00, m10, m01) == (expected['m00'], expected['m10'], expected['m01'])
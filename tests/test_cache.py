@@ -0,0 +1,53 @@
+import numpy as np
+
+from processing.cache import ResultCache
+
+def _key(cache, image):
+    return cache.make_key(np.negative, image, (3,), {'mode': 'edge'})
+
+def test_put_and_get_same_key():
+    cache = ResultCache(max_bytes=1024)
+    image = np.zeros((4, 4), dtype=np.uint8)
+    result = np.ones((4, 4), dtype=np.uint8)
+    cache.put(_key(cache, image), result)
+    assert cache.get(_key(cache, image.copy())) is result
+
+def test_oversized_result_replaces_existing_entry():
+    cache = ResultCache(max_bytes=100)
+    image = np.zeros((4, 4), dtype=np.uint8)
+    key = _key(cache, image)
+    cache.put(key, np.ones((4, 4), dtype=np.uint8))
+    # Yeni sonuç bütçeyi aşıyor: saklanmaz, ama eski sonuç da kalmamalı
+    cache.put(key, np.ones((20, 20), dtype=np.uint8))
+    assert cache.get(key) is None
+    assert len(cache) == 0
+    assert cache.current_bytes == 0
+
+def test_eviction_keeps_total_within_budget():
+    cache = ResultCache(max_bytes=40)
+    for value in range(5):
+        image = np.full((2, 2), value, dtype=np.uint8)
+        cache.put(_key(cache, image), np.zeros(16, dtype=np.uint8))
+    assert cache.current_bytes <= 40
+    assert len(cache) == 2
+
+class _Sized:
+    # ndarray olmayan ama boyutu bilinen sonuç
+    nbytes = 30
+
+def test_non_array_results_are_stored_and_evicted():
+    cache = ResultCache(max_bytes=40)
+    keys = [_key(cache, np.full((2, 2), value, dtype=np.uint8)) for value in range(4)]
+    cache.put(keys[0], [1, 2, 3])
+    cache.put(keys[1], None)
+    assert cache.get(keys[0]) == [1, 2, 3]
+    assert cache.get(keys[1], default='yok') is None
+    assert cache.hits == 2
+    # Boyutu bilinen sonuç bütçeyi doldurur; en eski kayıtlar hatasız atılır
+    cache.put(keys[2], _Sized())
+    cache.put(keys[3], _Sized())
+    assert cache.current_bytes == 30
+    assert cache.get(keys[2], default='yok') == 'yok'
+    assert isinstance(cache.get(keys[3]), _Sized)
+    cache.put(keys[3], 'yeni')
+    assert cache.current_bytes == 0
@@ -0,0 +1,133 @@
+import cv2
+import numpy as np
+import pytest
+
+from processing.filters import (
+    SOBEL_MAX_MAGNITUDE, box_filter, edge_detection, mean_filter, median_filter, sharpening_filter,
+    smoothing_filter, smoothing_filter_gray,
+)
+
+def _text_like(height=96, width=128, seed=0):
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width), 255, dtype=np.uint8)
+    for _ in range(60):
+        y, x = rng.integers(0, height - 8), rng.integers(0, width - 12)
+        image[y:y + int(rng.integers(2, 8)), x:x + int(rng.integers(2, 12))] = rng.integers(0, 120)
+    return image
+
+def _random_image(channels, seed=0, height=13, width=17):
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    return np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+def _reference_loop(image, kernel_size, reduce):
+    # Eski uygulamalardaki gibi piksel piksel pencere döngüsü ('edge' dolgusu, kanal kanal)
+    if image.ndim == 3:
+        return np.dstack([_reference_loop(image[..., c], kernel_size, reduce)
+                          for c in range(image.shape[2])])
+    pad = kernel_size // 2
+    padded = np.pad(image, pad, mode='edge')
+    out = np.zeros_like(image)
+    for i in range(image.shape[0]):
+        for j in range(image.shape[1]):
+            out[i, j] = reduce(padded[i:i + kernel_size, j:j + kernel_size])
+    return out
+
+def _sharpen_reference(region):
+    kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+    return np.clip(np.sum(region * kernel), 0, 255)
+
+def _mean_reference(region):
+    # Tam sayı toplamın kesilmiş ortalaması
+    return int(region.sum(dtype=np.int64)) // region.size
+
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('kernel_size', [2, 3, 4, 5])
+def test_median_methods_match_reference_loop(channels, kernel_size):
+    image = _random_image(channels, seed=kernel_size)
+    expected = _reference_loop(image, kernel_size, np.median)
+    methods = ['auto', 'sort', 'histogram'] + (['opencv'] if kernel_size % 2 else [])
+    for method in methods:
+        assert np.array_equal(median_filter(image, kernel_size, method=method), expected), method
+
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('kernel_size', [2, 3, 4, 5])
+def test_box_and_mean_filter_match_reference_loop(channels, kernel_size):
+    image = _random_image(channels, seed=kernel_size)
+    expected = _reference_loop(image, kernel_size, _mean_reference)
+    assert np.array_equal(box_filter(image, kernel_size), expected)
+    assert np.array_equal(mean_filter(image, kernel_size), expected)
+
+@pytest.mark.parametrize('channels', [1, 3])
+def test_sharpening_matches_reference_loop(channels):
+    image = _random_image(channels)
+    assert np.array_equal(sharpening_filter(image), _reference_loop(image, 3, _sharpen_reference))
+
+@pytest.mark.parametrize('kernel_size', [3, 5, 9, 15])
+def test_smoothing_matches_dense_reference(kernel_size):
+    image = _text_like()
+    assert np.array_equal(smoothing_filter(image, kernel_size), smoothing_filter_gray(image, kernel_size))
+
+def test_smoothing_color_matches_per_channel_reference():
+    image = np.dstack([_text_like(seed=s) for s in range(3)])
+    expected = np.dstack([smoothing_filter_gray(image[..., c], 5) for c in range(3)])
+    assert np.array_equal(smoothing_filter(image, 5), expected)
+
+@pytest.mark.parametrize('value', [0, 1, 127, 254, 255])
+@pytest.mark.parametrize('kernel_size', [3, 4, 5, 7])
+def test_smoothing_truncates_constant_image_like_reference(value, kernel_size):
+    # Sabit görüntüde toplam tam sayının hemen altına düşebilir; iki yol da aynı şekilde kesmeli
+    image = np.full((40, 50), value, dtype=np.uint8)
+    assert np.array_equal(smoothing_filter(image, kernel_size), smoothing_filter_gray(image, kernel_size))
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint16, np.int32])
+def test_smoothing_matches_dense_reference_on_flat_regions(dtype):
+    # Düz bölgeler ve sert geçişler: tam sayıya çok yakın toplamların çoğu burada oluşur
+    rng = np.random.default_rng(1)
+    image = (rng.integers(0, 4, (12, 16)).repeat(5, axis=0).repeat(5, axis=1) * 60).astype(dtype)
+    for kernel_size in (3, 5, 9):
+        assert np.array_equal(smoothing_filter(image, kernel_size), smoothing_filter_gray(image, kernel_size))
+
+def _sobel_reference(gray):
+    # Eski edge_detection döngüsü: float32 türevler ve büyüklük
+    sobel_x = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]])
+    sobel_y = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]])
+    padded = np.pad(gray, 1, mode='edge')
+    grad_x = np.zeros_like(gray, dtype=np.float32)
+    grad_y = np.zeros_like(gray, dtype=np.float32)
+    for i in range(gray.shape[0]):
+        for j in range(gray.shape[1]):
+            region = padded[i:i + 3, j:j + 3]
+            grad_x[i, j] = np.sum(region * sobel_x)
+            grad_y[i, j] = np.sum(region * sobel_y)
+    return np.sqrt(grad_x**2 + grad_y**2)
+
+@pytest.mark.parametrize('channels', [1, 3])
+def test_edge_detection_default_matches_reference_loop(channels):
+    image = _random_image(channels, seed=5, height=21, width=30)
+    gray = image if channels == 1 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    magnitude = _sobel_reference(gray)
+    expected = (magnitude / np.max(magnitude) * 255).astype(np.uint8)
+    assert np.array_equal(edge_detection(image), expected)
+    assert np.array_equal(edge_detection(image, 'two_pass'), expected)
+
+def test_edge_detection_fixed_scale_does_not_depend_on_content():
+    image = _text_like(40, 60) // 2 + 60
+    # Görüntünün başka bir yerine daha güçlü (0-255) bir kenar eklenir
+    stronger = image.copy()
+    stronger[30:, 50:] = 0
+    stronger[35:, 55:] = 255
+    unchanged = (slice(0, 25), slice(0, 45))
+    for candidate in (image, stronger):
+        magnitude = _sobel_reference(candidate)
+        expected = np.minimum(magnitude / np.float32(SOBEL_MAX_MAGNITUDE) * 255, 255).astype(np.uint8)
+        assert np.array_equal(edge_detection(candidate, 'fixed'), expected)
+        scaled = np.minimum(magnitude / np.float32(300.0) * 255, 255).astype(np.uint8)
+        assert np.array_equal(edge_detection(candidate, 'fixed', max_magnitude=300.0), scaled)
+    # Sabit ölçekte uzaktaki pikseller değişmez; görüntü geneli normalizasyonda değişir
+    assert np.array_equal(edge_detection(image, 'fixed')[unchanged], edge_detection(stronger, 'fixed')[unchanged])
+    assert not np.array_equal(edge_detection(image)[unchanged], edge_detection(stronger)[unchanged])
+
+def test_edge_detection_of_constant_image_is_black():
+    image = np.full((10, 12), 77, dtype=np.uint8)
+    for normalization in ('global', 'fixed', 'two_pass', 'tile'):
+        assert not edge_detection(image, normalization).any()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from processing.filters import box_filter, edge_detection
+from processing.outofcore import create_output_memmap, open_image_memmap, stream_apply
+from processing.threshold import kapur_threshold, manual_threshold, otsu_threshold
+from test_tiling import CASES, _case_id, _test_image
+
+def _stream(tmp_path, func, image, *args, **kwargs):
+    # Kaynak diskten bellek eşlemli açılır, sonuç .npy dosyasına yazılır
+    np.save(tmp_path / 'kaynak.npy', image)
+    source = open_image_memmap(str(tmp_path / 'kaynak.npy'))
+    out = stream_apply(func, source, str(tmp_path / 'sonuc.npy'), *args, tile_size=48, **kwargs)
+    return np.array(out)
+
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('case', CASES, ids=_case_id)
+def test_stream_apply_matches_direct_call(tmp_path, case, channels):
+    func, args, kwargs = case
+    image = _test_image(channels)
+    assert np.array_equal(_stream(tmp_path, func, image, *args, **kwargs), func(image, *args, **kwargs))
+
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('func, args, kwargs', [
+    (otsu_threshold, (), {}),
+    (kapur_threshold, (), {}),
+    (manual_threshold, (100,), {}),
+    (edge_detection, (), {}),
+    (edge_detection, ('two_pass',), {}),
+], ids=lambda value: getattr(value, '__name__', repr(value)))
+def test_stream_apply_two_pass_operations_match_direct_call(tmp_path, func, args, kwargs, channels):
+    # Görüntü geneli eşikler ve normalizasyon önce tüm karolardan toplanır
+    image = _test_image(channels)
+    assert np.array_equal(_stream(tmp_path, func, image, *args, **kwargs), func(image, *args, **kwargs))
+
+def test_stream_apply_keeps_written_tiles_after_releasing_pages(tmp_path):
+    # Sayfalar her karodan sonra bırakılır; yazılan veriler kaybolmamalı
+    image = np.random.default_rng(0).integers(0, 256, (700, 900), dtype=np.uint8)
+    np.save(tmp_path / 'kaynak.npy', image)
+    source = open_image_memmap(str(tmp_path / 'kaynak.npy'))
+    out = create_output_memmap(str(tmp_path / 'sonuc.npy'), image.shape)
+    stream_apply(box_filter, source, out, 5, tile_size=256)
+    del out
+    assert np.array_equal(np.load(tmp_path / 'sonuc.npy'), box_filter(image, 5))
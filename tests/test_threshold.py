@@ -0,0 +1,71 @@
+import cv2
+import numpy as np
+import pytest
+
+from processing.threshold import select_threshold
+
+def _sample_images(seed=0, count=40):
+    # Düzgün, tek tepeli, iki tepeli, sabit ve birkaç gri seviyeli görüntüler
+    rng = np.random.default_rng(seed)
+    images = []
+    for i in range(count):
+        kind = i % 5
+        if kind == 0:
+            image = rng.integers(0, 256, (60, 70))
+        elif kind == 1:
+            image = rng.normal(rng.uniform(30, 220), rng.uniform(1, 40), (50, 50))
+        elif kind == 2:
+            dark = rng.random((40, 40)) < rng.random()
+            image = np.where(dark, rng.normal(60, 10, (40, 40)), rng.normal(180, 20, (40, 40)))
+        elif kind == 3:
+            image = np.full((10, 10), rng.integers(0, 256))
+        else:
+            image = rng.choice(rng.integers(0, 256, rng.integers(2, 5)), (30, 30))
+        images.append(np.clip(image, 0, 255).astype(np.uint8))
+    return images
+
+def _histogram(image):
+    return np.bincount(image.ravel(), minlength=256)
+
+def test_otsu_matches_opencv():
+    images = _sample_images()
+    batch = select_threshold(np.stack([_histogram(im) for im in images]), 'otsu')
+    for image, from_batch in zip(images, batch):
+        expected, _ = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        assert select_threshold(_histogram(image), 'otsu') == expected
+        assert from_batch == expected
+
+def _three_class_criterion(hist, method):
+    # Tüm (t1, t2) çiftleri için ölçüt; sınıflar [0, t1], [t1 + 1, t2], [t2 + 1, 255]
+    p = hist / hist.sum()
+    levels = np.arange(256)
+    weight = np.concatenate([[0.0], np.cumsum(p)])
+    if method == 'otsu':
+        # Sınıflar arası varyans: sum w_k (mu_k - mu)^2
+        moment = np.concatenate([[0.0], np.cumsum(p * levels)])
+    else:
+        # Sınıf entropilerinin toplamı: H_k = log w_k - sum(p log p) / w_k
+        moment = np.concatenate([[0.0], np.cumsum(p * np.log(np.where(p > 0, p, 1.0)))])
+    t1, t2 = np.meshgrid(levels, levels, indexing='ij')
+    total = np.zeros(t1.shape)
+    for lo, hi in ((np.zeros_like(t1), t1 + 1), (t1 + 1, t2 + 1), (t2 + 1, np.full_like(t1, 256))):
+        w = weight[hi] - weight[lo]
+        m = moment[hi] - moment[lo]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if method == 'otsu':
+                term = w * (m / w - moment[-1]) ** 2
+            else:
+                term = np.log(w) - m / w
+        total += np.where(w > 0, term, 0.0)
+    return np.where(t1 < t2, total, -np.inf)
+
+@pytest.mark.parametrize('method', ['otsu', 'kapur'])
+def test_three_class_search_matches_brute_force(method):
+    rng = np.random.default_rng(1)
+    hists = rng.integers(0, 50, (6, 256)) * (rng.random((6, 256)) < 0.3)
+    hists[:, 0] += 1
+    thresholds = select_threshold(hists, method, classes=3)
+    for hist, (t1, t2) in zip(hists, thresholds):
+        criterion = _three_class_criterion(hist.astype(np.float64), method)
+        assert t1 < t2
+        assert criterion[t1, t2] == pytest.approx(criterion.max(), rel=1e-9, abs=1e-12)
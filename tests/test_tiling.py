@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from processing.filters import (
+    box_filter, edge_detection, mean_filter, median_filter, sharpening_filter, smoothing_filter,
+)
+from processing.morphology import dilation, erosion, rect_max, rect_min
+from processing.threshold import adaptive_local_threshold, niblack_threshold, sauvola_threshold
+from processing.tiling import _HALO, apply_tiled, operation_halo, parallel_apply, supports_tiling
+
+# (işlem, argümanlar, anahtar kelimeler); her _HALO girdisi en az bir kez yer alır
+CASES = [
+    (edge_detection, (), {'normalization': 'fixed'}),
+    (edge_detection, ('fixed', 900.0), {}),
+    (mean_filter, (4,), {}),
+    (box_filter, (7,), {}),
+    (median_filter, (5,), {}),
+    (median_filter, (4,), {'method': 'histogram'}),
+    (smoothing_filter, (5,), {}),
+    (sharpening_filter, (), {}),
+    (dilation, ((3, 6),), {}),
+    (erosion, (5,), {}),
+    (rect_max, (4,), {}),
+    (rect_min, (3,), {'border_value': 0}),
+    (adaptive_local_threshold, (15, 5), {}),
+    (adaptive_local_threshold, (), {'window_size': 21, 'method': 'sauvola'}),
+    (niblack_threshold, (11,), {}),
+    (sauvola_threshold, (25,), {}),
+]
+
+def _test_image(channels=3):
+    # Boyutlar bant/karo boyutunun katı değil
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (25, 20, channels), dtype=np.uint8)
+    image = np.kron(base, np.ones((8, 8, 1), dtype=np.uint8))[:197, :151]
+    noise = rng.integers(-20, 21, image.shape)
+    image = np.clip(image + noise, 0, 255).astype(np.uint8)
+    return image if channels == 3 else image[..., 0]
+
+def _case_id(case):
+    func, args, kwargs = case
+    return f"{func.__name__}{args}{kwargs}"
+
+def test_cases_cover_every_halo_entry():
+    assert set(_HALO) == {func for func, _, _ in CASES}
+
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('case', CASES, ids=_case_id)
+def test_parallel_apply_matches_direct_call(case, channels):
+    func, args, kwargs = case
+    image = _test_image(channels)
+    expected = func(image, *args, **kwargs)
+    assert supports_tiling(func, *args, **kwargs)
+    result = parallel_apply(func, image, *args, band_rows=29, workers=3, **kwargs)
+    assert np.array_equal(result, expected)
+    halo = operation_halo(func, image, *args, **kwargs)
+    assert np.array_equal(apply_tiled(func, image, *args, halo=halo, band_rows=50, workers=2, **kwargs),
+                          expected)
+
+def test_global_edge_normalization_is_not_tiled():
+    image = _test_image(1)
+    assert not supports_tiling(edge_detection)
+    with pytest.raises(ValueError):
+        parallel_apply(edge_detection, image, band_rows=29)